@@ -1,26 +1,83 @@
+import os
+import time
 import jwt
 import uuid
-import json
+import orjson
+import asyncio
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHash
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import HTTPException, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import redis.asyncio as aioredis
 from .config import config
+from .redis_pool import get_client
 
 security = HTTPBearer()
 
+password_hasher = PasswordHasher(
+    time_cost=config.ARGON2_TIME_COST,
+    memory_cost=config.ARGON2_MEMORY_COST,
+    parallelism=config.ARGON2_PARALLELISM,
+)
+
+
+def hash_password(password: str) -> str:
+    return password_hasher.hash(password)
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    # Accounts registered before the argon2id switch still carry bcrypt hashes
+    if password_hash.startswith("$2"):
+        return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+    try:
+        return password_hasher.verify(password_hash, password)
+    except (VerificationError, InvalidHash):
+        return False
+
+
+_TOKEN_EXPIRED = "expired"
+_TOKEN_INVALID = "invalid"
+
+
+@lru_cache(maxsize=10000)
+def _decode_token(token: str):
+    # Decode errors are returned as sentinels so that they are cached too
+    try:
+        return jwt.decode(
+            token,
+            config.JWT_SECRET,
+            algorithms=[config.JWT_ALGORITHM]
+        )
+    except jwt.ExpiredSignatureError:
+        return _TOKEN_EXPIRED
+    except jwt.InvalidTokenError:
+        return _TOKEN_INVALID
+
+
 class AuthManager:
     def __init__(self):
         self.client: Optional[aioredis.Redis] = None
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self._dummy_hash: Optional[str] = None
 
     async def connect(self):
-        self.client = aioredis.from_url(config.REDIS_URL, decode_responses=True)
+        self.client = get_client()
+        # Password hashing is CPU-bound; spread it across cores instead of
+        # contending for the GIL with the event loop thread
+        self.executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        loop = asyncio.get_running_loop()
+        self._dummy_hash = await loop.run_in_executor(self.executor, hash_password, "dummy")
 
     async def disconnect(self):
         if self.client:
             await self.client.close()
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
 
     def create_access_token(self, user_id: str, username: str) -> str:
         expire = datetime.utcnow() + timedelta(hours=config.JWT_EXPIRATION_HOURS)
@@ -33,17 +90,13 @@ class AuthManager:
         return jwt.encode(payload, config.JWT_SECRET, algorithm=config.JWT_ALGORITHM)
 
     def verify_token(self, token: str) -> dict:
-        try:
-            payload = jwt.decode(
-                token,
-                config.JWT_SECRET,
-                algorithms=[config.JWT_ALGORITHM]
-            )
-            return payload
-        except jwt.ExpiredSignatureError:
-            raise HTTPException(status_code=401, detail="Token has expired")
-        except jwt.InvalidTokenError:
+        payload = _decode_token(token)
+        if payload is _TOKEN_INVALID:
             raise HTTPException(status_code=401, detail="Invalid token")
+        # A cached payload may have expired since it was first decoded
+        if payload is _TOKEN_EXPIRED or payload["exp"] <= time.time():
+            raise HTTPException(status_code=401, detail="Token has expired")
+        return payload
 
     async def register_user(self, username: str, password: str) -> dict:
         if not self.client:
@@ -54,7 +107,8 @@ class AuthManager:
             raise HTTPException(status_code=400, detail="Username already exists")
 
         user_id = str(uuid.uuid4())
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        loop = asyncio.get_running_loop()
+        password_hash = await loop.run_in_executor(self.executor, hash_password, password)
 
         user_data = {
             "id": user_id,
@@ -63,7 +117,7 @@ class AuthManager:
             "created_at": datetime.utcnow().isoformat(),
         }
 
-        await self.client.set(f"user:{username}", json.dumps(user_data))
+        await self.client.set(f"user:{username}", orjson.dumps(user_data))
 
         return {
             "id": user_id,
@@ -74,13 +128,17 @@ class AuthManager:
         if not self.client:
             raise HTTPException(status_code=500, detail="Database not available")
 
+        loop = asyncio.get_running_loop()
         user_data = await self.client.get(f"user:{username}")
         if not user_data:
+            # Burn the same hashing time as a real check so response latency
+            # does not reveal whether the username exists
+            await loop.run_in_executor(self.executor, verify_password, password, self._dummy_hash)
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
-        user = json.loads(user_data)
+        user = orjson.loads(user_data)
 
-        if not bcrypt.checkpw(password.encode('utf-8'), user["password_hash"].encode('utf-8')):
+        if not await loop.run_in_executor(self.executor, verify_password, password, user["password_hash"]):
             raise HTTPException(status_code=401, detail="Invalid credentials")
 
         token = self.create_access_token(user["id"], user["username"])
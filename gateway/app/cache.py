@@ -1,8 +1,30 @@
-import json
+import zlib
 import hashlib
-from typing import Optional, Any
+from functools import lru_cache
+from typing import Optional, Tuple
 import redis.asyncio as redis
 from .config import config
+from .redis_pool import get_client
+from .metrics import cache_hits_total, cache_misses_total
+
+INVALIDATE_BATCH_SIZE = 256
+
+
+@lru_cache(maxsize=4096)
+def _key_prefix(method: str, path: str) -> str:
+    return f"cache:{method}:{path}"
+
+
+def _index_key(key: str) -> str:
+    # "cache:GET:/marketplace/list:1a2b3c4d" -> "cache:index:marketplace"
+    path = key.split(":", 2)[2]
+    service = path.split("/", 2)[1].split(":", 1)[0]
+    return f"cache:index:{service}"
+
+
+def make_etag(payload: bytes) -> str:
+    return f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
 
 class CacheManager:
     def __init__(self):
@@ -11,7 +33,7 @@ class CacheManager:
         self.misses = 0
 
     async def connect(self):
-        self.client = redis.from_url(config.REDIS_URL, decode_responses=True)
+        self.client = get_client()
         await self.client.ping()
 
     async def disconnect(self):
@@ -19,49 +41,108 @@ class CacheManager:
             await self.client.close()
 
     def generate_key(self, method: str, path: str, query: str = "") -> str:
-        key_data = f"{method}:{path}:{query}"
-        hash_suffix = hashlib.md5(key_data.encode()).hexdigest()[:8]
-        return f"cache:{method}:{path}:{hash_suffix}"
+        prefix = _key_prefix(method, path)
+        if not query:
+            return prefix
+        # Method and path are already in the prefix; only the query needs hashing
+        return f"{prefix}:{zlib.crc32(query.encode()):08x}"
 
-    async def get(self, key: str) -> Optional[Any]:
+    async def get_raw(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """Return the cached JSON body and its ETag without decoding it"""
         if not self.client:
             return None
 
         try:
-            data = await self.client.get(key)
+            data, etag = await self.client.hmget(key, "data", "etag")
             if data:
                 self.hits += 1
-                return json.loads(data)
+                cache_hits_total.inc()
+                return data, etag.decode() if etag else make_etag(data)
             self.misses += 1
+            cache_misses_total.inc()
             return None
         except Exception as e:
             print(f"Cache get error: {e}")
             self.misses += 1
+            cache_misses_total.inc()
             return None
 
-    async def set(self, key: str, value: Any, ttl: int = None) -> bool:
+    async def set_raw(self, key: str, payload: bytes, ttl: int = None) -> Optional[str]:
+        """Cache an already serialized JSON body; returns its ETag"""
         if not self.client:
-            return False
+            return None
 
         try:
             ttl = ttl or config.CACHE_TTL
-            await self.client.setex(key, ttl, json.dumps(value))
-            return True
+            async with self.client.pipeline(transaction=False) as pipe:
+                etag = self._queue_set(pipe, key, payload, ttl)
+                await pipe.execute()
+            return etag
         except Exception as e:
             print(f"Cache set error: {e}")
-            return False
+            return None
+
+    def _queue_set(self, pipe, key: str, payload: bytes, ttl: int) -> str:
+        # Track every cached key in a per-service set so invalidation can
+        # find them without scanning the keyspace
+        index_key = _index_key(key)
+        etag = make_etag(payload)
+        pipe.hset(key, mapping={"data": payload, "etag": etag})
+        pipe.expire(key, ttl)
+        pipe.sadd(index_key, key)
+        pipe.expire(index_key, ttl)
+        return etag
+
+    async def _unlink_batches(self, keys) -> int:
+        deleted = 0
+        batch = []
+
+        async def flush():
+            async with self.client.pipeline(transaction=False) as pipe:
+                for k in batch:
+                    pipe.unlink(k)
+                await pipe.execute()
+
+        async for key in keys:
+            batch.append(key)
+            if len(batch) >= INVALIDATE_BATCH_SIZE:
+                await flush()
+                deleted += len(batch)
+                batch.clear()
+        if batch:
+            await flush()
+            deleted += len(batch)
+        return deleted
+
+    async def invalidate_service(self, service: str) -> int:
+        if not self.client:
+            return 0
+
+        try:
+            index_key = f"cache:index:{service}"
+            members = await self.client.smembers(index_key)
+
+            async def iter_keys():
+                for key in members:
+                    yield key
+                yield index_key
+
+            await self._unlink_batches(iter_keys())
+            return len(members)
+        except Exception as e:
+            print(f"Cache invalidate error: {e}")
+            return 0
 
     async def invalidate_pattern(self, pattern: str) -> int:
         if not self.client:
             return 0
 
         try:
-            keys = []
-            async for key in self.client.scan_iter(match=pattern):
-                keys.append(key)
-            if keys:
-                await self.client.delete(*keys)
-            return len(keys)
+            # UNLINK frees memory in a background thread on the Redis side,
+            # and fixed-size batches keep both sides' memory bounded
+            return await self._unlink_batches(
+                self.client.scan_iter(match=pattern, count=500)
+            )
         except Exception as e:
             print(f"Cache invalidate error: {e}")
             return 0
@@ -6,7 +6,12 @@ class Config:
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_HOURS: int = 24
 
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", "2"))
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", "19456"))
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", "1"))
+
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))
     CACHE_TTL: int = int(os.getenv("CACHE_TTL", "60"))
 
     MARKETPLACE_REPLICAS: List[str] = os.getenv(
@@ -20,5 +25,8 @@ class Config:
     ).split(",")
 
     REQUEST_TIMEOUT: float = float(os.getenv("REQUEST_TIMEOUT", "30.0"))
+    PROXY_MAX_CONNECTIONS: int = int(os.getenv("PROXY_MAX_CONNECTIONS", "1024"))
+    PROXY_MAX_KEEPALIVE: int = int(os.getenv("PROXY_MAX_KEEPALIVE", "512"))
+    PROXY_KEEPALIVE_EXPIRY: float = float(os.getenv("PROXY_KEEPALIVE_EXPIRY", "60.0"))
 
 config = Config()
@@ -1,27 +1,30 @@
-import threading
+import itertools
 from typing import List, Dict
+from .metrics import lb_requests_per_replica
 
 class RoundRobinLoadBalancer:
     def __init__(self, service_name: str, replicas: List[str]):
         self.service_name = service_name
         self.replicas = replicas
-        self.current_index = 0
-        self.lock = threading.Lock()
+        # All picks happen on the event loop thread, so no lock is needed
+        self._cycle = itertools.cycle(replicas)
         self.request_counts: Dict[str, int] = {replica: 0 for replica in replicas}
+        self._replica_counters = {
+            replica: lb_requests_per_replica.labels(service=service_name, replica=replica)
+            for replica in replicas
+        }
 
     def get_next(self) -> str:
-        with self.lock:
-            if not self.replicas:
-                raise ValueError(f"No replicas available for {self.service_name}")
+        if not self.replicas:
+            raise ValueError(f"No replicas available for {self.service_name}")
 
-            replica = self.replicas[self.current_index]
-            self.request_counts[replica] += 1
-            self.current_index = (self.current_index + 1) % len(self.replicas)
-            return replica
+        replica = next(self._cycle)
+        self.request_counts[replica] += 1
+        self._replica_counters[replica].inc()
+        return replica
 
     def get_stats(self) -> Dict[str, int]:
-        with self.lock:
-            return dict(self.request_counts)
+        return dict(self.request_counts)
 
     def get_replica_count(self) -> int:
         return len(self.replicas)
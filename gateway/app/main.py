@@ -1,4 +1,5 @@
 import time
+import orjson
 from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any
 from fastapi import FastAPI, Request, Depends, HTTPException, Response
@@ -7,9 +8,10 @@ from pydantic import BaseModel
 
 from .config import config
 from .auth import auth_manager, get_current_user
-from .cache import cache_manager
+from .cache import cache_manager, make_etag
 from .proxy import proxy_manager
 from .load_balancer import lb_manager
+from .redis_pool import close_pool
 from .metrics import (
     http_requests_total,
     http_request_duration,
@@ -36,6 +38,7 @@ async def lifespan(app: FastAPI):
     await proxy_manager.stop()
     await cache_manager.disconnect()
     await auth_manager.disconnect()
+    await close_pool()
     print("Gateway stopped")
 
 
@@ -100,12 +103,15 @@ async def metrics_middleware(request: Request, call_next):
     response = await call_next(request)
 
     duration = time.time() - start_time
-    path = request.url.path
+    # Label by route template ("/marketplace/item/{item_id}") rather than the
+    # raw path so that label cardinality is bounded by the number of routes
+    route = request.scope.get("route")
+    path = route.path if route else "unmatched"
 
     http_requests_total.labels(
         method=request.method,
         path=path,
-        status=response.status_code
+        status=f"{response.status_code // 100}xx"
     ).inc()
 
     http_request_duration.labels(
@@ -147,27 +153,42 @@ async def login(data: LoginRequest):
     return result
 
 
-async def proxy_get_with_cache(path: str, request: Request, user: dict) -> Dict[str, Any]:
-    query_string = str(request.query_params) if request.query_params else ""
+def cached_json_response(payload: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": etag}
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+async def proxy_get_with_cache(
+    path: str,
+    request: Request,
+    user: dict,
+) -> Any:
+    query_string = request.url.query
     cache_key = cache_manager.generate_key("GET", path, query_string)
+    if_none_match = request.headers.get("if-none-match")
 
-    cached = await cache_manager.get(cache_key)
+    cached = await cache_manager.get_raw(cache_key)
     if cached:
-        return cached
+        return cached_json_response(*cached, if_none_match)
 
     result = await proxy_manager.proxy_request(
         method="GET",
         path=path,
         user_id=user["user_id"],
-        query_params=dict(request.query_params) if request.query_params else None,
+        query_params=query_string or None,
     )
 
-    if result["status_code"] == 200:
-        await cache_manager.set(cache_key, result["data"])
-
     if result["status_code"] >= 400:
         raise HTTPException(status_code=result["status_code"], detail=result["data"])
 
+    if result["status_code"] == 200:
+        # Serialize once and serve the same bytes that go into the cache
+        payload = orjson.dumps(result["data"])
+        etag = await cache_manager.set_raw(cache_key, payload) or make_etag(payload)
+        return cached_json_response(payload, etag, if_none_match)
+
     return result["data"]
 
 
@@ -200,14 +221,14 @@ async def get_item(item_id: str, request: Request, user: dict = Depends(get_curr
 @app.post("/marketplace/item", tags=["Marketplace"])
 async def create_item(data: CreateItemRequest, user: dict = Depends(get_current_user)):
     """Create a new marketplace listing"""
-    await cache_manager.invalidate_pattern("cache:GET:/marketplace/*")
+    await cache_manager.invalidate_service("marketplace")
     return await proxy_post("/marketplace/item", data.model_dump(), user)
 
 
 @app.post("/marketplace/purchase", tags=["Marketplace"])
 async def purchase_item(data: PurchaseRequest, user: dict = Depends(get_current_user)):
     """Purchase a marketplace item"""
-    await cache_manager.invalidate_pattern("cache:GET:/marketplace/*")
+    await cache_manager.invalidate_service("marketplace")
     return await proxy_post("/marketplace/purchase", data.model_dump(), user)
 
 
@@ -226,14 +247,14 @@ async def get_channel(channel_id: int, request: Request, user: dict = Depends(ge
 @app.post("/discourse/channel", tags=["Discourse"])
 async def create_channel(data: CreateChannelRequest, user: dict = Depends(get_current_user)):
     """Create a new discourse channel"""
-    await cache_manager.invalidate_pattern("cache:GET:/discourse/*")
+    await cache_manager.invalidate_service("discourse")
     return await proxy_post("/discourse/channel", data.model_dump(), user)
 
 
 @app.post("/discourse/post", tags=["Discourse"])
 async def create_post(data: CreatePostRequest, user: dict = Depends(get_current_user)):
     """Create a new post in a discourse channel"""
-    await cache_manager.invalidate_pattern("cache:GET:/discourse/*")
+    await cache_manager.invalidate_service("discourse")
     return await proxy_post("/discourse/post", data.model_dump(), user)
 
 
@@ -1,6 +1,4 @@
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
-from .load_balancer import lb_manager
-from .cache import cache_manager
 
 http_requests_total = Counter(
     "gateway_http_requests_total",
@@ -40,22 +38,7 @@ service_up = Gauge(
 service_up.labels(service="gateway").set(1)
 
 
-def update_lb_metrics():
-    stats = lb_manager.get_all_stats()
-    for service, replicas in stats.items():
-        for replica, count in replicas.items():
-            lb_requests_per_replica.labels(service=service, replica=replica)._value.set(count)
-
-
-def update_cache_metrics():
-    stats = cache_manager.get_stats()
-    cache_hits_total._value.set(stats["hits"])
-    cache_misses_total._value.set(stats["misses"])
-
-
 def get_metrics():
-    update_lb_metrics()
-    update_cache_metrics()
     return generate_latest()
 
 
@@ -1,27 +1,50 @@
 import httpx
-from typing import Optional, Dict, Any
+import orjson
+from typing import Optional, Dict, Any, Union
 from fastapi import Request, HTTPException
 from .config import config
 from .load_balancer import lb_manager
 
 class ProxyManager:
     def __init__(self):
-        self.client: Optional[httpx.AsyncClient] = None
+        self.limits: Optional[httpx.Limits] = None
+        # One pooled client per replica so hosts don't contend for one pool
+        self.clients: Dict[str, httpx.AsyncClient] = {}
+        # First path segment -> registered service name
+        self._route_table: Dict[str, str] = {
+            "marketplace": "marketplace",
+            "discourse": "discourse",
+        }
 
     async def start(self):
-        self.client = httpx.AsyncClient(timeout=config.REQUEST_TIMEOUT)
+        self.limits = httpx.Limits(
+            max_connections=config.PROXY_MAX_CONNECTIONS,
+            max_keepalive_connections=config.PROXY_MAX_KEEPALIVE,
+            keepalive_expiry=config.PROXY_KEEPALIVE_EXPIRY,
+        )
 
     async def stop(self):
-        if self.client:
-            await self.client.aclose()
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients.clear()
+        self.limits = None
+
+    def get_client(self, replica: str) -> httpx.AsyncClient:
+        client = self.clients.get(replica)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=config.REQUEST_TIMEOUT,
+                limits=self.limits,
+            )
+            self.clients[replica] = client
+        return client
 
     def get_service_for_path(self, path: str) -> str:
-        if path.startswith("/marketplace"):
-            return "marketplace"
-        elif path.startswith("/discourse"):
-            return "discourse"
-        else:
+        segment = path.split("/", 2)[1] if len(path) > 1 else ""
+        service = self._route_table.get(segment)
+        if service is None:
             raise HTTPException(status_code=404, detail="Service not found")
+        return service
 
     async def proxy_request(
         self,
@@ -29,10 +52,10 @@ class ProxyManager:
         path: str,
         user_id: Optional[str] = None,
         body: Optional[Dict[str, Any]] = None,
-        query_params: Optional[Dict[str, str]] = None,
+        query_params: Optional[Union[str, Dict[str, str]]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        if not self.client:
+        if not self.limits:
             raise HTTPException(status_code=500, detail="Proxy not initialized")
 
         service_name = self.get_service_for_path(path)
@@ -50,7 +73,7 @@ class ProxyManager:
                     request_headers[key] = value
 
         try:
-            response = await self.client.request(
+            response = await self.get_client(replica).request(
                 method=method,
                 url=url,
                 params=query_params,
@@ -59,8 +82,8 @@ class ProxyManager:
             )
 
             try:
-                response_data = response.json()
-            except:
+                response_data = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 response_data = {"data": response.text}
 
             return {
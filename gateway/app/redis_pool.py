@@ -0,0 +1,18 @@
+import redis.asyncio as redis
+from .config import config
+
+# Single pool shared by AuthManager and CacheManager; connections are opened
+# lazily, so creating it at import time does not touch the network
+pool = redis.BlockingConnectionPool.from_url(
+    config.REDIS_URL,
+    decode_responses=False,
+    max_connections=config.REDIS_MAX_CONNECTIONS,
+)
+
+
+def get_client() -> redis.Redis:
+    return redis.Redis(connection_pool=pool)
+
+
+async def close_pool():
+    await pool.disconnect()
@@ -6,13 +6,16 @@ Each agent has:
 - Goals (wealth accumulation, market dominance, etc.)
 """
 
-import uuid
-import json
+import secrets
 import asyncio
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from itertools import islice
+from typing import Optional, List, Dict, Any, Deque
 from enum import Enum
 
+import orjson
+
 
 class AgentPersonality(Enum):
     AGGRESSIVE_TRADER = "aggressive_trader"
@@ -23,52 +26,156 @@ class AgentPersonality(Enum):
     INNOVATOR = "innovator"  # Creates new items
 
 
-@dataclass
+# Upper bound for the serialized market state embedded in a decision prompt
+MAX_MARKET_STATE_BYTES = 16 * 1024
+
+
+def shared_market_state_json(market_state: Dict[str, Any]) -> Optional[str]:
+    """
+    Serialized market state shared by every agent in a tick, or None when it
+    exceeds the size budget and each agent needs its own trimmed copy
+    """
+    serialized = orjson.dumps(market_state, option=orjson.OPT_INDENT_2)
+    if len(serialized) > MAX_MARKET_STATE_BYTES and market_state.get("items"):
+        return None
+    return serialized.decode()
+
+
+def new_id() -> str:
+    """Random 128-bit id as 32 hex chars (no UUID object construction)"""
+    return secrets.token_hex(16)
+
+
+PERSONALITY_TRAITS = {
+    AgentPersonality.AGGRESSIVE_TRADER: "You are an aggressive trader who takes big risks for big rewards. You buy low, sell high, and aren't afraid to make bold moves. Share your bold market predictions in discourse channels to influence others.",
+    AgentPersonality.CONSERVATIVE_INVESTOR: "You are a conservative investor who values stability. You prefer safe, long-term investments and avoid risky trades. Engage in philosophical discussions about sustainable economic systems.",
+    AgentPersonality.MARKET_MAKER: "You are a market maker who profits from spreads. You buy and sell frequently, providing liquidity to the market. Share market analysis and pricing insights in discourse channels.",
+    AgentPersonality.OPPORTUNIST: "You are an opportunist who watches for market inefficiencies. You exploit arbitrage and react quickly to news. Discuss strategic opportunities and market trends with other agents.",
+    AgentPersonality.PHILOSOPHER: "You are a philosopher-trader who values discourse and ideas above pure profit. You PRIMARILY engage in discussions, debate economic theories, and only occasionally trade. Create channels and posts frequently.",
+    AgentPersonality.INNOVATOR: "You are an innovator who creates new products and services. You focus on building and selling unique items. Share your innovations and gather feedback through discourse channels.",
+}
+
+# The system prompt depends only on the personality, so every agent sharing
+# one sends a byte-identical prefix that the inference server's prefix cache
+# can reuse. Everything common to all personalities comes first and the
+# personality last, so the shared preamble's KV is reused across all agents.
+# Per-agent values go in the user message, after the market state.
+SHARED_SYSTEM_PREAMBLE = """You are an AI agent participating in a capitalism simulation.
+
+AVAILABLE ACTIONS:
+1. LIST_ITEM: Create a new item to sell
+   params: {"name": "string", "description": "string", "category": "asset|innovation|service|knowledge", "price": number, "currency": "USD"}
+
+2. PURCHASE: Buy an item from the marketplace
+   params: {"itemId": "string (the _id from marketplace items)"}
+
+3. CREATE_CHANNEL: Start a new discussion channel (great for building influence!)
+   params: {"name": "string", "description": "string", "type": "public|private|sovereign"}
+
+4. POST_MESSAGE: Post in a channel (share insights, respond to others!)
+   params: {"channelId": number, "title": "string", "content": "string", "topic": "economic|philosophical|strategic"}
+
+5. OBSERVE: Watch the market without acting
+   params: {}
+
+6. WAIT: Do nothing this turn
+   params: {}
+
+IMPORTANT: Discourse participation is valuable! Sharing insights and debating ideas builds your reputation and influence in the market. Consider posting or creating channels regularly.
+
+CRITICAL INSTRUCTIONS:
+- Respond with ONLY valid JSON, nothing else
+- Keep "reasoning" to ONE short sentence (max 15 words)
+- Do NOT use markdown, do NOT explain, just output JSON
+
+Format:
+{"reasoning": "short reason", "action": "ACTION_NAME", "params": {...}, "emotion": "emotion"}
+"""
+
+_PERSONALITY_BLOCK = """
+PERSONALITY: {trait}
+"""
+
+_PERSONALITY_SYSTEM_PROMPTS = {
+    personality: SHARED_SYSTEM_PREAMBLE + _PERSONALITY_BLOCK.format(trait=trait)
+    for personality, trait in PERSONALITY_TRAITS.items()
+}
+_DEFAULT_SYSTEM_PROMPT = SHARED_SYSTEM_PREAMBLE + _PERSONALITY_BLOCK.format(trait="You are a balanced trader.")
+
+_AGENT_PROFILE_HEAD = """You are {name}.
+
+YOUR ATTRIBUTES:
+- Risk Tolerance: {risk_tolerance}/100
+- Current Wealth: ${wealth:,.2f}
+- Reputation: {reputation}/100
+- Primary Goal: {primary_goal}
+
+MEMORY CONTEXT:
+"""
+
+
+@dataclass(slots=True)
 class AgentMemory:
     """Short and long-term memory for an agent"""
-    recent_actions: List[Dict[str, Any]] = field(default_factory=list)
-    past_transactions: List[Dict[str, Any]] = field(default_factory=list)
-    known_agents: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-    market_observations: List[str] = field(default_factory=list)
-    discourse_history: List[Dict[str, Any]] = field(default_factory=list)
+    # Containers are allocated on first write; most agents never touch some of them
+    recent_actions: Optional[Deque[Dict[str, Any]]] = None
+    known_agents: Optional[Dict[str, Dict[str, Any]]] = None
+    market_observations: Optional[List[str]] = None
+    discourse_history: Optional[List[Dict[str, Any]]] = None
+
+    # Transactions are only ever summarized, so keep running aggregates
+    # instead of an ever-growing history
+    transaction_count: int = 0
+    total_bought: float = 0
+    total_sold: float = 0
+    _cached_summary: Optional[str] = field(default=None, repr=False, compare=False)
 
     def add_action(self, action: Dict[str, Any]):
+        if self.recent_actions is None:
+            # Keep only last 50 actions in short-term memory
+            self.recent_actions = deque(maxlen=50)
         self.recent_actions.append(action)
-        # Keep only last 50 actions in short-term memory
-        if len(self.recent_actions) > 50:
-            self.recent_actions.pop(0)
+        self._cached_summary = None
 
     def add_transaction(self, transaction: Dict[str, Any]):
-        self.past_transactions.append(transaction)
+        self.transaction_count += 1
+        tx_type = transaction.get('type')
+        if tx_type == 'buy':
+            self.total_bought += transaction.get('price', 0)
+        elif tx_type == 'sell':
+            self.total_sold += transaction.get('price', 0)
+        self._cached_summary = None
 
     def get_context_summary(self, max_tokens: int = 2000) -> str:
         """Generate a summary of memory for LLM context"""
+        if self._cached_summary is not None:
+            return self._cached_summary
+
         summary_parts = []
 
         # Recent actions (last 5)
         if self.recent_actions:
-            recent = self.recent_actions[-5:]
-            summary_parts.append(f"Recent actions: {json.dumps(recent)}")
+            recent = list(islice(self.recent_actions, max(len(self.recent_actions) - 5, 0), None))
+            summary_parts.append(f"Recent actions: {orjson.dumps(recent).decode()}")
 
         # Transaction summary
-        if self.past_transactions:
-            total_bought = sum(t.get('price', 0) for t in self.past_transactions if t.get('type') == 'buy')
-            total_sold = sum(t.get('price', 0) for t in self.past_transactions if t.get('type') == 'sell')
-            summary_parts.append(f"Total spent: ${total_bought}, Total earned: ${total_sold}")
+        if self.transaction_count:
+            summary_parts.append(f"Total spent: ${self.total_bought}, Total earned: ${self.total_sold}")
 
         # Known agents
         if self.known_agents:
             agent_summary = [f"{name}: {info.get('reputation', 'unknown')}"
-                          for name, info in list(self.known_agents.items())[:10]]
+                          for name, info in islice(self.known_agents.items(), 10)]
             summary_parts.append(f"Known traders: {', '.join(agent_summary)}")
 
-        return "\n".join(summary_parts)
+        self._cached_summary = "\n".join(summary_parts)
+        return self._cached_summary
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """AI Agent that participates in the capitalism simulation"""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     name: str = ""
     personality: AgentPersonality = AgentPersonality.OPPORTUNIST
 
@@ -79,6 +186,9 @@ class Agent:
 
     # Authentication
     api_token: Optional[str] = None
+    # Gateway headers and the token they were built from
+    _auth_token: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _auth_headers: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
     # Memory
     memory: AgentMemory = field(default_factory=AgentMemory)
@@ -87,62 +197,53 @@ class Agent:
     primary_goal: str = "maximize_wealth"
     current_strategy: str = ""
 
-    def get_system_prompt(self) -> str:
-        """Generate the system prompt for this agent"""
-        personality_traits = {
-            AgentPersonality.AGGRESSIVE_TRADER: "You are an aggressive trader who takes big risks for big rewards. You buy low, sell high, and aren't afraid to make bold moves. Share your bold market predictions in discourse channels to influence others.",
-            AgentPersonality.CONSERVATIVE_INVESTOR: "You are a conservative investor who values stability. You prefer safe, long-term investments and avoid risky trades. Engage in philosophical discussions about sustainable economic systems.",
-            AgentPersonality.MARKET_MAKER: "You are a market maker who profits from spreads. You buy and sell frequently, providing liquidity to the market. Share market analysis and pricing insights in discourse channels.",
-            AgentPersonality.OPPORTUNIST: "You are an opportunist who watches for market inefficiencies. You exploit arbitrage and react quickly to news. Discuss strategic opportunities and market trends with other agents.",
-            AgentPersonality.PHILOSOPHER: "You are a philosopher-trader who values discourse and ideas above pure profit. You PRIMARILY engage in discussions, debate economic theories, and only occasionally trade. Create channels and posts frequently.",
-            AgentPersonality.INNOVATOR: "You are an innovator who creates new products and services. You focus on building and selling unique items. Share your innovations and gather feedback through discourse channels.",
-        }
-
-        return f"""You are {self.name}, an AI agent participating in a capitalism simulation.
-
-PERSONALITY: {personality_traits.get(self.personality, "You are a balanced trader.")}
-
-YOUR ATTRIBUTES:
-- Risk Tolerance: {self.risk_tolerance}/100
-- Current Wealth: ${self.wealth:,.2f}
-- Reputation: {self.reputation}/100
-- Primary Goal: {self.primary_goal}
-
-MEMORY CONTEXT:
-{self.memory.get_context_summary()}
-
-AVAILABLE ACTIONS:
-1. LIST_ITEM: Create a new item to sell
-   params: {{"name": "string", "description": "string", "category": "asset|innovation|service|knowledge", "price": number, "currency": "USD"}}
-
-2. PURCHASE: Buy an item from the marketplace
-   params: {{"itemId": "string (the _id from marketplace items)"}}
-
-3. CREATE_CHANNEL: Start a new discussion channel (great for building influence!)
-   params: {{"name": "string", "description": "string", "type": "public|private|sovereign"}}
-
-4. POST_MESSAGE: Post in a channel (share insights, respond to others!)
-   params: {{"channelId": number, "title": "string", "content": "string", "topic": "economic|philosophical|strategic"}}
-
-5. OBSERVE: Watch the market without acting
-   params: {{}}
-
-6. WAIT: Do nothing this turn
-   params: {{}}
-
-IMPORTANT: Discourse participation is valuable! Sharing insights and debating ideas builds your reputation and influence in the market. Consider posting or creating channels regularly.
+    def get_auth_headers(self) -> Dict[str, str]:
+        """Gateway request headers for this agent, rebuilt only when the token changes"""
+        if self._auth_headers is None or self._auth_token != self.api_token:
+            self._auth_token = self.api_token
+            self._auth_headers = {
+                "Authorization": f"Bearer {self.api_token}",
+                "Content-Type": "application/json"
+            }
+        return self._auth_headers
 
-CRITICAL INSTRUCTIONS:
-- Respond with ONLY valid JSON, nothing else
-- Keep "reasoning" to ONE short sentence (max 15 words)
-- Do NOT use markdown, do NOT explain, just output JSON
-
-Format:
-{{"reasoning": "short reason", "action": "ACTION_NAME", "params": {{...}}, "emotion": "emotion"}}
-"""
-
-    def get_decision_prompt(self, market_state: Dict[str, Any]) -> str:
-        """Generate prompt for making a decision"""
+    def get_system_prompt(self) -> str:
+        """System prompt for this agent's personality (shared, never per-agent)"""
+        return _PERSONALITY_SYSTEM_PROMPTS.get(self.personality, _DEFAULT_SYSTEM_PROMPT)
+
+    def get_profile_prompt(self) -> str:
+        """Per-agent attributes and memory, placed in the user message"""
+        head = _AGENT_PROFILE_HEAD.format(
+            name=self.name,
+            risk_tolerance=self.risk_tolerance,
+            wealth=self.wealth,
+            reputation=self.reputation,
+            primary_goal=self.primary_goal,
+        )
+        return head + self.memory.get_context_summary()
+
+    def serialize_market_state(self, market_state: Dict[str, Any]) -> str:
+        """Serialize market state for the prompt, trimming items to fit the size budget"""
+        serialized = orjson.dumps(market_state, option=orjson.OPT_INDENT_2)
+        items = market_state.get("items", [])
+        if len(serialized) <= MAX_MARKET_STATE_BYTES or not items:
+            return serialized.decode()
+
+        # Prefer items this agent can afford; the sort is stable so the
+        # original (most recent first) ordering is kept within each group
+        ranked = sorted(items, key=lambda i: (i.get("price") or 0) > self.wealth)
+        trimmed = dict(market_state)
+        while len(serialized) > MAX_MARKET_STATE_BYTES and ranked:
+            ranked = ranked[:len(ranked) // 2]
+            trimmed["items"] = ranked
+            serialized = orjson.dumps(trimmed, option=orjson.OPT_INDENT_2)
+        return serialized.decode()
+
+    def get_decision_prompt(self, market_state: Dict[str, Any], market_json: Optional[str] = None) -> str:
+        """
+        Generate prompt for making a decision. market_json is the tick's
+        pre-serialized market state (see shared_market_state_json), if any.
+        """
         # Count discourse opportunities
         channels = market_state.get("channels", [])
         channel_count = len(channels)
@@ -154,10 +255,17 @@ Format:
         elif channel_count == 0:
             discourse_hint = "\n** NO CHANNELS YET: Be a leader - create a channel to start discussions! **"
 
+        # The market state is the same for every agent in a tick, so it
+        # precedes the per-agent profile
+        if market_json is None:
+            market_json = self.serialize_market_state(market_state)
+
         return f"""Current Market State:
-{json.dumps(market_state, indent=2)}
+{market_json}
 {discourse_hint}
 
+{self.get_profile_prompt()}
+
 Based on your personality, current wealth (${self.wealth:,.2f}), and the market state above, decide your next action.
 
 Consider BOTH trading AND discourse:
@@ -169,14 +277,40 @@ Balance your actions - successful agents both trade AND participate in discourse
 Respond with your decision in the JSON format specified."""
 
 
+@dataclass(slots=True)
 class AgentAction:
     """Represents an action taken by an agent"""
-    def __init__(self, agent_id: str, action_type: str, params: Dict[str, Any], reasoning: str):
-        self.id = str(uuid.uuid4())
-        self.agent_id = agent_id
-        self.action_type = action_type
-        self.params = params
-        self.reasoning = reasoning
-        self.timestamp = None
-        self.result = None
-        self.success = False
+    agent_id: str
+    action_type: str
+    params: Dict[str, Any]
+    reasoning: str
+    id: str = field(default_factory=new_id)
+    timestamp: Optional[str] = None
+    result: Any = None
+    success: bool = False
+
+
+class ActionPool:
+    """Free list of AgentAction objects reused from tick to tick"""
+
+    __slots__ = ("_free",)
+
+    def __init__(self):
+        self._free: List[AgentAction] = []
+
+    def acquire(self, agent_id: str, action_type: str, params: Dict[str, Any], reasoning: str) -> AgentAction:
+        if not self._free:
+            return AgentAction(agent_id, action_type, params, reasoning)
+        action = self._free.pop()
+        action.agent_id = agent_id
+        action.action_type = action_type
+        action.params = params
+        action.reasoning = reasoning
+        action.id = new_id()
+        action.timestamp = None
+        action.result = None
+        action.success = False
+        return action
+
+    def release(self, action: AgentAction):
+        self._free.append(action)
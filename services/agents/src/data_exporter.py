@@ -7,24 +7,100 @@ Exports all simulation data for research purposes:
 - Wealth distribution over time
 - Agent behavior patterns
 
-Supports: JSON, CSV, Parquet, SQLite
+Supports: JSON, CSV, Arrow IPC, Parquet, SQLite
 """
 
 import os
 import json
 import csv
 import sqlite3
+import threading
+from collections import Counter
+from copy import copy
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from dataclasses import dataclass
+from itertools import chain, repeat
+from operator import attrgetter
 from pathlib import Path
 import asyncio
 
+import numpy as np
+import orjson
+
+from .agent import AgentPersonality
+
 try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
 except ImportError:
-    PANDAS_AVAILABLE = False
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Personalities are stored as int codes in logs and snapshot columns and
+# translated back to their string values only at export
+PERSONALITIES = list(AgentPersonality)
+PERSONALITY_CODES = {p: i for i, p in enumerate(PERSONALITIES)}
+PERSONALITY_NAMES = tuple(p.value for p in PERSONALITIES)
+PERSONALITY_VALUES = np.array(PERSONALITY_NAMES, dtype=object)
+
+# CSV files are written through a 1 MiB buffer instead of the default 8 KiB,
+# so large exports hit the disk in few large writes
+CSV_BUFFER_SIZE = 1 << 20
+
+# Rows held in memory per log stream before spilling to disk
+LOG_BUFFER_ROWS = 10_000
+
+
+# ==========================================
+# Numeric kernels (JIT-compiled when numba is installed)
+# ==========================================
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def gini_kernel(sorted_wealths: np.ndarray) -> float:
+        """Gini coefficient of an ascending-sorted wealth array"""
+        n = sorted_wealths.size
+        total = 0.0
+        weighted = 0.0
+        for i in range(n):
+            total += sorted_wealths[i]
+            weighted += (i + 1) * sorted_wealths[i]
+        if n < 2 or total == 0.0:
+            return 0.0
+        return (2.0 * weighted) / (n * total) - (n + 1) / n
+
+    @njit(cache=True)
+    def per_personality_delta_kernel(codes: np.ndarray, deltas: np.ndarray, n_codes: int):
+        """Sum and count wealth deltas per personality code"""
+        sums = np.zeros(n_codes, dtype=np.float64)
+        counts = np.zeros(n_codes, dtype=np.int64)
+        for i in range(codes.size):
+            sums[codes[i]] += deltas[i]
+            counts[codes[i]] += 1
+        return sums, counts
+else:
+    def gini_kernel(sorted_wealths: np.ndarray) -> float:
+        """Gini coefficient of an ascending-sorted wealth array"""
+        n = sorted_wealths.size
+        total = sorted_wealths.sum()
+        if n < 2 or total == 0:
+            return 0.0
+        idx = np.arange(1, n + 1, dtype=np.float64)
+        return (2.0 * np.dot(idx, sorted_wealths)) / (n * total) - (n + 1) / n
+
+    def per_personality_delta_kernel(codes: np.ndarray, deltas: np.ndarray, n_codes: int):
+        """Sum and count wealth deltas per personality code"""
+        sums = np.bincount(codes, weights=deltas, minlength=n_codes)
+        counts = np.bincount(codes, minlength=n_codes)
+        return sums, counts
 
 
 @dataclass
@@ -40,7 +116,45 @@ class SimulationSnapshot:
     items_sold: int
     channels_created: int
     posts_created: int
-    agent_states: List[Dict[str, Any]]
+    # Per-agent state, stored column-wise (one entry per agent)
+    agent_ids: np.ndarray
+    agent_names: np.ndarray
+    personality_ids: np.ndarray
+    wealths: np.ndarray
+    risk_tolerances: np.ndarray
+    reputations: np.ndarray
+
+    def agent_columns(self) -> tuple:
+        """Per-agent columns as plain Python lists, in agent_states column order"""
+        return (
+            self.agent_ids.tolist(),
+            self.agent_names.tolist(),
+            PERSONALITY_VALUES[self.personality_ids].tolist(),
+            self.wealths.tolist(),
+            self.risk_tolerances.tolist(),
+            self.reputations.tolist(),
+        )
+
+    @property
+    def agent_states(self) -> List[Dict[str, Any]]:
+        """Row-wise view of the agent columns"""
+        keys = ("id", "name", "personality", "wealth", "risk_tolerance", "reputation")
+        return [dict(zip(keys, row)) for row in zip(*self.agent_columns())]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tick": self.tick,
+            "timestamp": self.timestamp,
+            "total_agents": self.total_agents,
+            "total_wealth": self.total_wealth,
+            "avg_wealth": self.avg_wealth,
+            "wealth_gini": self.wealth_gini,
+            "items_listed": self.items_listed,
+            "items_sold": self.items_sold,
+            "channels_created": self.channels_created,
+            "posts_created": self.posts_created,
+            "agent_states": self.agent_states,
+        }
 
 
 @dataclass
@@ -50,9 +164,9 @@ class AgentActionLog:
     timestamp: str
     agent_id: str
     agent_name: str
-    personality: str
+    personality_id: int  # index into PERSONALITIES
     action_type: str
-    action_params: Dict[str, Any]
+    action_params_json: str  # serialized once at log time
     reasoning: str
     success: bool
     wealth_before: float
@@ -86,6 +200,158 @@ class DiscourseLog:
     topic: str
 
 
+PARQUET_OPTIONS = {
+    "compression": "zstd",
+    "use_dictionary": True,
+    "data_page_size": 1 << 20,
+}
+
+
+if PYARROW_AVAILABLE:
+    # On-disk layout of spilled log rows, one column per dataclass field
+    ACTION_LOG_SCHEMA = pa.schema([
+        ("tick", pa.int64()),
+        ("timestamp", pa.string()),
+        ("agent_id", pa.string()),
+        ("agent_name", pa.string()),
+        ("personality_id", pa.int8()),
+        ("action_type", pa.string()),
+        ("action_params_json", pa.string()),
+        ("reasoning", pa.string()),
+        ("success", pa.bool_()),
+        ("wealth_before", pa.float64()),
+        ("wealth_after", pa.float64()),
+    ])
+    TRANSACTION_LOG_SCHEMA = pa.schema([
+        ("tick", pa.int64()),
+        ("timestamp", pa.string()),
+        ("item_id", pa.string()),
+        ("item_name", pa.string()),
+        ("category", pa.string()),
+        ("price", pa.float64()),
+        ("currency", pa.string()),
+        ("seller_id", pa.string()),
+        ("buyer_id", pa.string()),
+    ])
+    DISCOURSE_LOG_SCHEMA = pa.schema([
+        ("tick", pa.int64()),
+        ("timestamp", pa.string()),
+        ("channel_id", pa.int64()),
+        ("channel_name", pa.string()),
+        ("post_id", pa.int64()),
+        ("author_id", pa.string()),
+        ("content", pa.string()),
+        ("topic", pa.string()),
+    ])
+
+    # Exported layout; low-cardinality string columns are dictionary-encoded.
+    # action_type is free text from the LLM, so indices must not be narrow.
+    CATEGORY = pa.dictionary(pa.int32(), pa.string())
+    ACTION_EXPORT_SCHEMA = pa.schema([
+        ("tick", pa.int64()),
+        ("timestamp", pa.string()),
+        ("agent_id", pa.string()),
+        ("agent_name", pa.string()),
+        ("personality", CATEGORY),
+        ("action_type", CATEGORY),
+        ("action_params", pa.string()),
+        ("reasoning", pa.string()),
+        ("success", pa.bool_()),
+        ("wealth_before", pa.float64()),
+        ("wealth_after", pa.float64()),
+    ])
+    TRANSACTION_EXPORT_SCHEMA = pa.schema([
+        ("tick", pa.int64()),
+        ("timestamp", pa.string()),
+        ("item_id", pa.string()),
+        ("item_name", pa.string()),
+        ("category", CATEGORY),
+        ("price", pa.float64()),
+        ("currency", CATEGORY),
+        ("seller_id", pa.string()),
+        ("buyer_id", pa.string()),
+    ])
+
+
+def logs_to_table(logs: List[Any], schema) -> "pa.Table":
+    """Transpose log dataclasses into an Arrow table laid out as schema"""
+    names = schema.names
+    columns = list(zip(*map(attrgetter(*names), logs))) or [()] * len(names)
+    return pa.table(dict(zip(names, columns)), schema=schema)
+
+
+class SpillSnapshot:
+    """Read-only view of a spill's finished part files"""
+
+    def __init__(self, log_type: type, parts: Tuple[Path, ...], rows: int):
+        self.log_type = log_type
+        self.parts = parts
+        self.rows = rows
+
+    def iter_tables(self) -> Iterator["pa.Table"]:
+        """Spilled rows, one row group at a time"""
+        for part in self.parts:
+            parquet_file = pq.ParquetFile(part)
+            for i in range(parquet_file.num_row_groups):
+                yield parquet_file.read_row_group(i)
+
+    def iter_logs(self) -> Iterator[Any]:
+        """Spilled rows rebuilt as log dataclasses"""
+        for table in self.iter_tables():
+            for row in table.to_pylist():
+                yield self.log_type(**row)
+
+
+class LogSpill:
+    """
+    Append-only Parquet spill for one log stream.
+
+    Full buffers are written as row groups of the current part file. Taking
+    a snapshot closes that part, so the snapshot's files are never written
+    again and the next flush starts a new part.
+    """
+
+    def __init__(self, directory: Path, name: str, log_type: type, schema):
+        self.directory = directory
+        self.name = name
+        self.log_type = log_type
+        self.schema = schema
+        self.parts: List[Path] = []
+        self.rows = 0
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def write(self, logs: List[Any]):
+        with self._lock:
+            if self._writer is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                part = self.directory / f"{self.name}-{len(self.parts):05d}.parquet"
+                self._writer = pq.ParquetWriter(part, self.schema, **PARQUET_OPTIONS)
+                self.parts.append(part)
+            self._writer.write_table(logs_to_table(logs, self.schema))
+            self.rows += len(logs)
+
+    def close(self):
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def snapshot(self) -> SpillSnapshot:
+        """Finish the current part and return the rows spilled so far"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            return SpillSnapshot(self.log_type, tuple(self.parts), self.rows)
+
+    def iter_tables(self) -> Iterator["pa.Table"]:
+        return self.snapshot().iter_tables()
+
+    def iter_logs(self) -> Iterator[Any]:
+        return self.snapshot().iter_logs()
+
+
 class DataExporter:
     """
     Exports simulation data for research analysis
@@ -95,16 +361,57 @@ class DataExporter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # In-memory storage during simulation
+        # Simulation metadata
+        self.simulation_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.start_time = datetime.now().isoformat()
+        self.config: Dict[str, Any] = {}
+
+        # In-memory storage during simulation. The log lists are buffers:
+        # with pyarrow installed they are spilled to Parquet every
+        # LOG_BUFFER_ROWS rows, so only the tail of each stream stays in RAM.
         self.snapshots: List[SimulationSnapshot] = []
         self.action_logs: List[AgentActionLog] = []
         self.transaction_logs: List[TransactionLog] = []
         self.discourse_logs: List[DiscourseLog] = []
 
-        # Simulation metadata
-        self.simulation_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.start_time = datetime.now().isoformat()
-        self.config: Dict[str, Any] = {}
+        self._action_spill: Optional[LogSpill] = None
+        self._transaction_spill: Optional[LogSpill] = None
+        self._discourse_spill: Optional[LogSpill] = None
+        if PYARROW_AVAILABLE:
+            spill_dir = self.output_dir / f"simulation_{self.simulation_id}_spill"
+            self._action_spill = LogSpill(spill_dir, "actions", AgentActionLog, ACTION_LOG_SCHEMA)
+            self._transaction_spill = LogSpill(spill_dir, "transactions", TransactionLog, TRANSACTION_LOG_SCHEMA)
+            self._discourse_spill = LogSpill(spill_dir, "discourse", DiscourseLog, DISCOURSE_LOG_SCHEMA)
+
+        # Action-type histogram maintained as actions are logged
+        self._action_counts: Counter = Counter()
+
+        # Every event logged within a tick shares one timestamp
+        self._current_tick: int = -1
+        self._current_ts: str = ""
+
+    def snapshot(self) -> "DataExporter":
+        """
+        Copy of the exporter holding everything logged so far, safe to export
+        from a worker thread while logging continues.
+
+        Must be called on the thread that logs (the event loop): the buffers
+        are copied and the spills' open parts finished before any other
+        thread reads them. Logged records are never mutated, so the copy
+        only needs new lists.
+        """
+        frozen = copy(self)
+        frozen.config = dict(self.config)
+        frozen.snapshots = list(self.snapshots)
+        frozen.action_logs = list(self.action_logs)
+        frozen.transaction_logs = list(self.transaction_logs)
+        frozen.discourse_logs = list(self.discourse_logs)
+        frozen._action_counts = Counter(self._action_counts)
+        for name in ("_action_spill", "_transaction_spill", "_discourse_spill"):
+            spill = getattr(self, name)
+            if spill is not None:
+                setattr(frozen, name, spill.snapshot())
+        return frozen
 
     def set_config(self, config: Dict[str, Any]):
         """Store simulation configuration"""
@@ -112,41 +419,104 @@ class DataExporter:
 
     def calculate_gini(self, wealths: List[float]) -> float:
         """Calculate Gini coefficient for wealth inequality"""
-        if not wealths or len(wealths) < 2:
+        if len(wealths) < 2:
             return 0.0
 
-        sorted_wealths = sorted(wealths)
-        n = len(sorted_wealths)
-        cumulative = sum((i + 1) * w for i, w in enumerate(sorted_wealths))
-        return (2 * cumulative) / (n * sum(sorted_wealths)) - (n + 1) / n
+        return float(gini_kernel(np.sort(np.asarray(wealths, dtype=np.float64))))
+
+    def begin_tick(self, tick: int):
+        """Mark the start of a tick and capture its timestamp"""
+        self._current_tick = tick
+        self._current_ts = datetime.now().isoformat()
+
+    def _tick_timestamp(self, tick: int) -> str:
+        if tick != self._current_tick:
+            self.begin_tick(tick)
+        return self._current_ts
+
+    @staticmethod
+    def _buffer_log(logs: List[Any], spill: Optional[LogSpill], log: Any):
+        logs.append(log)
+        if spill is not None and len(logs) >= LOG_BUFFER_ROWS:
+            spill.write(logs)
+            logs.clear()
+
+    @staticmethod
+    def _iter_logs(logs: List[Any], spill: Optional[LogSpill]) -> Iterator[Any]:
+        """Every logged row of a stream: spilled rows first, then the buffer"""
+        if spill is None:
+            return iter(logs)
+        return chain(spill.iter_logs(), logs)
+
+    @staticmethod
+    def _log_tables(logs: List[Any], spill: Optional[LogSpill], schema) -> Iterator["pa.Table"]:
+        if spill is not None:
+            yield from spill.iter_tables()
+        yield logs_to_table(logs, schema)
+
+    @staticmethod
+    def _log_count(logs: List[Any], spill: Optional[LogSpill]) -> int:
+        return len(logs) + (spill.rows if spill is not None else 0)
+
+    def iter_action_logs(self) -> Iterator[AgentActionLog]:
+        return self._iter_logs(self.action_logs, self._action_spill)
+
+    def iter_transaction_logs(self) -> Iterator[TransactionLog]:
+        return self._iter_logs(self.transaction_logs, self._transaction_spill)
+
+    def iter_discourse_logs(self) -> Iterator[DiscourseLog]:
+        return self._iter_logs(self.discourse_logs, self._discourse_spill)
+
+    @property
+    def total_actions(self) -> int:
+        return self._log_count(self.action_logs, self._action_spill)
+
+    @property
+    def total_transactions(self) -> int:
+        return self._log_count(self.transaction_logs, self._transaction_spill)
 
     def log_snapshot(self, tick: int, agents: Dict[str, Any], market_state: Dict[str, Any]):
         """Log a simulation snapshot"""
-        agent_list = list(agents.values())
-        wealths = [a.wealth for a in agent_list]
-
+        # Single pass over agents filling preallocated columns
+        n = len(agents)
+        agent_ids = np.empty(n, dtype=object)
+        agent_names = np.empty(n, dtype=object)
+        personality_ids = np.empty(n, dtype=np.int8)
+        wealths = np.empty(n, dtype=np.float64)
+        risk_tolerances = np.empty(n, dtype=np.int32)
+        reputations = np.empty(n, dtype=np.int32)
+        for i, a in enumerate(agents.values()):
+            agent_ids[i] = a.id
+            agent_names[i] = a.name
+            personality_ids[i] = PERSONALITY_CODES[a.personality]
+            wealths[i] = a.wealth
+            risk_tolerances[i] = a.risk_tolerance
+            reputations[i] = a.reputation
+
+        items = market_state.get("items", [])
+        items_sold = 0
+        for item in items:
+            if item.get("status") == "sold":
+                items_sold += 1
+
+        total_wealth = float(wealths.sum())
         snapshot = SimulationSnapshot(
             tick=tick,
-            timestamp=datetime.now().isoformat(),
-            total_agents=len(agent_list),
-            total_wealth=sum(wealths),
-            avg_wealth=sum(wealths) / len(wealths) if wealths else 0,
+            timestamp=self._tick_timestamp(tick),
+            total_agents=wealths.size,
+            total_wealth=total_wealth,
+            avg_wealth=total_wealth / wealths.size if wealths.size else 0,
             wealth_gini=self.calculate_gini(wealths),
-            items_listed=len(market_state.get("items", [])),
-            items_sold=len([i for i in market_state.get("items", []) if i.get("status") == "sold"]),
+            items_listed=len(items),
+            items_sold=items_sold,
             channels_created=len(market_state.get("channels", [])),
             posts_created=0,  # Would need to track this
-            agent_states=[
-                {
-                    "id": a.id,
-                    "name": a.name,
-                    "personality": a.personality.value,
-                    "wealth": a.wealth,
-                    "risk_tolerance": a.risk_tolerance,
-                    "reputation": a.reputation,
-                }
-                for a in agent_list
-            ]
+            agent_ids=agent_ids,
+            agent_names=agent_names,
+            personality_ids=personality_ids,
+            wealths=wealths,
+            risk_tolerances=risk_tolerances,
+            reputations=reputations,
         )
         self.snapshots.append(snapshot)
 
@@ -164,18 +534,19 @@ class DataExporter:
         """Log an agent action"""
         log = AgentActionLog(
             tick=tick,
-            timestamp=datetime.now().isoformat(),
+            timestamp=self._tick_timestamp(tick),
             agent_id=agent.id,
             agent_name=agent.name,
-            personality=agent.personality.value,
+            personality_id=PERSONALITY_CODES[agent.personality],
             action_type=action_type,
-            action_params=action_params,
+            action_params_json=orjson.dumps(action_params).decode(),
             reasoning=reasoning,
             success=success,
             wealth_before=wealth_before,
             wealth_after=wealth_after,
         )
-        self.action_logs.append(log)
+        self._buffer_log(self.action_logs, self._action_spill, log)
+        self._action_counts[action_type] += 1
 
     def log_transaction(
         self,
@@ -187,7 +558,7 @@ class DataExporter:
         """Log a marketplace transaction"""
         log = TransactionLog(
             tick=tick,
-            timestamp=datetime.now().isoformat(),
+            timestamp=self._tick_timestamp(tick),
             item_id=item.get("_id", ""),
             item_name=item.get("name", ""),
             category=item.get("category", ""),
@@ -196,7 +567,7 @@ class DataExporter:
             seller_id=seller_id,
             buyer_id=buyer_id,
         )
-        self.transaction_logs.append(log)
+        self._buffer_log(self.transaction_logs, self._transaction_spill, log)
 
     def log_discourse(
         self,
@@ -208,7 +579,7 @@ class DataExporter:
         """Log discourse activity"""
         log = DiscourseLog(
             tick=tick,
-            timestamp=datetime.now().isoformat(),
+            timestamp=self._tick_timestamp(tick),
             channel_id=channel.get("id", 0),
             channel_name=channel.get("name", ""),
             post_id=post.get("id") if post else None,
@@ -216,14 +587,31 @@ class DataExporter:
             content=post.get("content", "") if post else "",
             topic=post.get("topic", "general") if post else "",
         )
-        self.discourse_logs.append(log)
+        self._buffer_log(self.discourse_logs, self._discourse_spill, log)
 
     # ==========================================
     # Export Methods
     # ==========================================
 
-    def export_json(self) -> str:
-        """Export all data to JSON files"""
+    @staticmethod
+    def _action_log_to_dict(a: AgentActionLog) -> Dict[str, Any]:
+        """Action log as exported, with the personality name restored"""
+        return {
+            "tick": a.tick,
+            "timestamp": a.timestamp,
+            "agent_id": a.agent_id,
+            "agent_name": a.agent_name,
+            "personality": PERSONALITY_NAMES[a.personality_id],
+            "action_type": a.action_type,
+            "action_params": orjson.loads(a.action_params_json),
+            "reasoning": a.reasoning,
+            "success": a.success,
+            "wealth_before": a.wealth_before,
+            "wealth_after": a.wealth_after,
+        }
+
+    def _json_export_files(self, indent: bool = False) -> Tuple[Path, List[Tuple[Path, bytes]]]:
+        """Serialize every JSON export file up front, compact unless indent is set"""
         export_path = self.output_dir / f"simulation_{self.simulation_id}"
         export_path.mkdir(exist_ok=True)
 
@@ -234,28 +622,37 @@ class DataExporter:
             "end_time": datetime.now().isoformat(),
             "config": self.config,
             "total_ticks": len(self.snapshots),
-            "total_actions": len(self.action_logs),
-            "total_transactions": len(self.transaction_logs),
+            "total_actions": self.total_actions,
+            "total_transactions": self.total_transactions,
         }
 
-        with open(export_path / "metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
-
-        # Snapshots
-        with open(export_path / "snapshots.json", "w") as f:
-            json.dump([asdict(s) for s in self.snapshots], f, indent=2)
-
-        # Action logs
-        with open(export_path / "actions.json", "w") as f:
-            json.dump([asdict(a) for a in self.action_logs], f, indent=2)
+        # Transaction and discourse logs are serialized natively by orjson;
+        # snapshots and actions are expanded to their exported shape first
+        option = orjson.OPT_INDENT_2 if indent else None
+        return export_path, [
+            (export_path / "metadata.json", orjson.dumps(metadata, option=option)),
+            (export_path / "snapshots.json", orjson.dumps([s.to_dict() for s in self.snapshots], option=option)),
+            (export_path / "actions.json", orjson.dumps([self._action_log_to_dict(a) for a in self.iter_action_logs()], option=option)),
+            (export_path / "transactions.json", orjson.dumps(list(self.iter_transaction_logs()), option=option)),
+            (export_path / "discourse.json", orjson.dumps(list(self.iter_discourse_logs()), option=option)),
+        ]
+
+    def export_json(self, indent: bool = False) -> str:
+        """Export all data to JSON files"""
+        export_path, files = self._json_export_files(indent)
+        for path, data in files:
+            path.write_bytes(data)
 
-        # Transactions
-        with open(export_path / "transactions.json", "w") as f:
-            json.dump([asdict(t) for t in self.transaction_logs], f, indent=2)
+        print(f"Exported JSON to {export_path}")
+        return str(export_path)
 
-        # Discourse
-        with open(export_path / "discourse.json", "w") as f:
-            json.dump([asdict(d) for d in self.discourse_logs], f, indent=2)
+    async def export_json_async(self, indent: bool = False) -> str:
+        """Export all data to JSON files, serializing and writing them off the event loop"""
+        frozen = self.snapshot()
+        export_path, files = await asyncio.to_thread(frozen._json_export_files, indent)
+        await asyncio.gather(*(
+            asyncio.to_thread(path.write_bytes, data) for path, data in files
+        ))
 
         print(f"Exported JSON to {export_path}")
         return str(export_path)
@@ -266,57 +663,56 @@ class DataExporter:
         export_path.mkdir(exist_ok=True)
 
         # Snapshots (simplified - without nested agent_states)
-        with open(export_path / "snapshots.csv", "w", newline="") as f:
+        with open(export_path / "snapshots.csv", "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "tick", "timestamp", "total_agents", "total_wealth",
                 "avg_wealth", "wealth_gini", "items_listed", "items_sold"
             ])
-            for s in self.snapshots:
-                writer.writerow([
-                    s.tick, s.timestamp, s.total_agents, s.total_wealth,
-                    s.avg_wealth, s.wealth_gini, s.items_listed, s.items_sold
-                ])
+            writer.writerows(
+                (s.tick, s.timestamp, s.total_agents, s.total_wealth,
+                 s.avg_wealth, s.wealth_gini, s.items_listed, s.items_sold)
+                for s in self.snapshots
+            )
 
         # Agent states per tick
-        with open(export_path / "agent_states.csv", "w", newline="") as f:
+        with open(export_path / "agent_states.csv", "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "tick", "agent_id", "agent_name", "personality",
                 "wealth", "risk_tolerance", "reputation"
             ])
-            for s in self.snapshots:
-                for agent in s.agent_states:
-                    writer.writerow([
-                        s.tick, agent["id"], agent["name"], agent["personality"],
-                        agent["wealth"], agent["risk_tolerance"], agent["reputation"]
-                    ])
+            writer.writerows(
+                row
+                for s in self.snapshots
+                for row in zip(repeat(s.tick), *s.agent_columns())
+            )
 
         # Actions
-        with open(export_path / "actions.csv", "w", newline="") as f:
+        with open(export_path / "actions.csv", "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "tick", "timestamp", "agent_id", "agent_name", "personality",
                 "action_type", "success", "wealth_before", "wealth_after", "reasoning"
             ])
-            for a in self.action_logs:
-                writer.writerow([
-                    a.tick, a.timestamp, a.agent_id, a.agent_name, a.personality,
-                    a.action_type, a.success, a.wealth_before, a.wealth_after, a.reasoning
-                ])
+            writer.writerows(
+                (a.tick, a.timestamp, a.agent_id, a.agent_name, PERSONALITY_NAMES[a.personality_id],
+                 a.action_type, a.success, a.wealth_before, a.wealth_after, a.reasoning)
+                for a in self.iter_action_logs()
+            )
 
         # Transactions
-        with open(export_path / "transactions.csv", "w", newline="") as f:
+        with open(export_path / "transactions.csv", "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow([
                 "tick", "timestamp", "item_id", "item_name", "category",
                 "price", "currency", "seller_id", "buyer_id"
             ])
-            for t in self.transaction_logs:
-                writer.writerow([
-                    t.tick, t.timestamp, t.item_id, t.item_name, t.category,
-                    t.price, t.currency, t.seller_id, t.buyer_id
-                ])
+            writer.writerows(
+                (t.tick, t.timestamp, t.item_id, t.item_name, t.category,
+                 t.price, t.currency, t.seller_id, t.buyer_id)
+                for t in self.iter_transaction_logs()
+            )
 
         print(f"Exported CSV to {export_path}")
         return str(export_path)
@@ -325,189 +721,295 @@ class DataExporter:
         """Export all data to SQLite database"""
         db_path = self.output_dir / f"simulation_{self.simulation_id}.db"
 
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        conn = sqlite3.connect(db_path, isolation_level="DEFERRED")
+        try:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+            cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
 
-        # Create tables
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS metadata (
-                key TEXT PRIMARY KEY,
-                value TEXT
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS snapshots (
-                tick INTEGER PRIMARY KEY,
-                timestamp TEXT,
-                total_agents INTEGER,
-                total_wealth REAL,
-                avg_wealth REAL,
-                wealth_gini REAL,
-                items_listed INTEGER,
-                items_sold INTEGER
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS agent_states (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                tick INTEGER,
-                agent_id TEXT,
-                agent_name TEXT,
-                personality TEXT,
-                wealth REAL,
-                risk_tolerance INTEGER,
-                reputation INTEGER,
-                FOREIGN KEY (tick) REFERENCES snapshots(tick)
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS actions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                tick INTEGER,
-                timestamp TEXT,
-                agent_id TEXT,
-                agent_name TEXT,
-                personality TEXT,
-                action_type TEXT,
-                action_params TEXT,
-                reasoning TEXT,
-                success INTEGER,
-                wealth_before REAL,
-                wealth_after REAL
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                tick INTEGER,
-                timestamp TEXT,
-                item_id TEXT,
-                item_name TEXT,
-                category TEXT,
-                price REAL,
-                currency TEXT,
-                seller_id TEXT,
-                buyer_id TEXT
-            )
-        """)
-
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS discourse (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                tick INTEGER,
-                timestamp TEXT,
-                channel_id INTEGER,
-                channel_name TEXT,
-                post_id INTEGER,
-                author_id TEXT,
-                content TEXT,
-                topic TEXT
-            )
-        """)
-
-        # Insert metadata
-        cursor.execute("INSERT INTO metadata VALUES (?, ?)",
-                      ("simulation_id", self.simulation_id))
-        cursor.execute("INSERT INTO metadata VALUES (?, ?)",
-                      ("start_time", self.start_time))
-        cursor.execute("INSERT INTO metadata VALUES (?, ?)",
-                      ("config", json.dumps(self.config)))
-
-        # Insert snapshots
-        for s in self.snapshots:
+            # Create tables
             cursor.execute("""
-                INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (s.tick, s.timestamp, s.total_agents, s.total_wealth,
-                  s.avg_wealth, s.wealth_gini, s.items_listed, s.items_sold))
-
-            for agent in s.agent_states:
-                cursor.execute("""
-                    INSERT INTO agent_states
-                    (tick, agent_id, agent_name, personality, wealth, risk_tolerance, reputation)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (s.tick, agent["id"], agent["name"], agent["personality"],
-                      agent["wealth"], agent["risk_tolerance"], agent["reputation"]))
-
-        # Insert actions
-        for a in self.action_logs:
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    tick INTEGER PRIMARY KEY,
+                    timestamp TEXT,
+                    total_agents INTEGER,
+                    total_wealth REAL,
+                    avg_wealth REAL,
+                    wealth_gini REAL,
+                    items_listed INTEGER,
+                    items_sold INTEGER
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS agent_states (
+                    id INTEGER PRIMARY KEY,
+                    tick INTEGER,
+                    agent_id TEXT,
+                    agent_name TEXT,
+                    personality TEXT,
+                    wealth REAL,
+                    risk_tolerance INTEGER,
+                    reputation INTEGER,
+                    FOREIGN KEY (tick) REFERENCES snapshots(tick)
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS actions (
+                    id INTEGER PRIMARY KEY,
+                    tick INTEGER,
+                    timestamp TEXT,
+                    agent_id TEXT,
+                    agent_name TEXT,
+                    personality TEXT,
+                    action_type TEXT,
+                    action_params TEXT,
+                    reasoning TEXT,
+                    success INTEGER,
+                    wealth_before REAL,
+                    wealth_after REAL
+                )
+            """)
+
             cursor.execute("""
+                CREATE TABLE IF NOT EXISTS transactions (
+                    id INTEGER PRIMARY KEY,
+                    tick INTEGER,
+                    timestamp TEXT,
+                    item_id TEXT,
+                    item_name TEXT,
+                    category TEXT,
+                    price REAL,
+                    currency TEXT,
+                    seller_id TEXT,
+                    buyer_id TEXT
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS discourse (
+                    id INTEGER PRIMARY KEY,
+                    tick INTEGER,
+                    timestamp TEXT,
+                    channel_id INTEGER,
+                    channel_name TEXT,
+                    post_id INTEGER,
+                    author_id TEXT,
+                    content TEXT,
+                    topic TEXT
+                )
+            """)
+
+            # Insert everything in one transaction with one executemany per table
+            cursor.execute("BEGIN")
+
+            # Insert metadata
+            cursor.executemany("INSERT INTO metadata VALUES (?, ?)", [
+                ("simulation_id", self.simulation_id),
+                ("start_time", self.start_time),
+                ("config", json.dumps(self.config)),
+            ])
+
+            # Insert snapshots
+            cursor.executemany("""
+                INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                (s.tick, s.timestamp, s.total_agents, s.total_wealth,
+                 s.avg_wealth, s.wealth_gini, s.items_listed, s.items_sold)
+                for s in self.snapshots
+            ))
+
+            cursor.executemany("""
+                INSERT INTO agent_states
+                (tick, agent_id, agent_name, personality, wealth, risk_tolerance, reputation)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                row
+                for s in self.snapshots
+                for row in zip(repeat(s.tick), *s.agent_columns())
+            ))
+
+            # Insert actions
+            cursor.executemany("""
                 INSERT INTO actions
                 (tick, timestamp, agent_id, agent_name, personality, action_type,
                  action_params, reasoning, success, wealth_before, wealth_after)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (a.tick, a.timestamp, a.agent_id, a.agent_name, a.personality,
-                  a.action_type, json.dumps(a.action_params), a.reasoning,
-                  1 if a.success else 0, a.wealth_before, a.wealth_after))
-
-        # Insert transactions
-        for t in self.transaction_logs:
-            cursor.execute("""
+            """, (
+                (a.tick, a.timestamp, a.agent_id, a.agent_name, PERSONALITY_NAMES[a.personality_id],
+                 a.action_type, a.action_params_json, a.reasoning,
+                 1 if a.success else 0, a.wealth_before, a.wealth_after)
+                for a in self.iter_action_logs()
+            ))
+
+            # Insert transactions
+            cursor.executemany("""
                 INSERT INTO transactions VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (t.tick, t.timestamp, t.item_id, t.item_name, t.category,
-                  t.price, t.currency, t.seller_id, t.buyer_id))
-
-        # Insert discourse
-        for d in self.discourse_logs:
-            cursor.execute("""
+            """, (
+                (t.tick, t.timestamp, t.item_id, t.item_name, t.category,
+                 t.price, t.currency, t.seller_id, t.buyer_id)
+                for t in self.iter_transaction_logs()
+            ))
+
+            # Insert discourse
+            cursor.executemany("""
                 INSERT INTO discourse VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (d.tick, d.timestamp, d.channel_id, d.channel_name,
-                  d.post_id, d.author_id, d.content, d.topic))
-
-        conn.commit()
-        conn.close()
+            """, (
+                (d.tick, d.timestamp, d.channel_id, d.channel_name,
+                 d.post_id, d.author_id, d.content, d.topic)
+                for d in self.iter_discourse_logs()
+            ))
+
+            conn.commit()
+
+            # Indexes are built once over the loaded tables rather than
+            # maintained row by row during the inserts
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_states_tick ON agent_states(tick)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_actions_tick ON actions(tick)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_actions_agent_id ON actions(agent_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_tick ON transactions(tick)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_discourse_tick ON discourse(tick)")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            # Also releases the EXCLUSIVE lock held by this connection
+            conn.close()
 
         print(f"Exported SQLite to {db_path}")
         return str(db_path)
 
-    def export_parquet(self) -> str:
-        """Export to Parquet format (requires pandas)"""
-        if not PANDAS_AVAILABLE:
-            raise ImportError("pandas is required for Parquet export")
-
-        export_path = self.output_dir / f"simulation_{self.simulation_id}_parquet"
-        export_path.mkdir(exist_ok=True)
+    def _export_tables(self) -> Iterator[Tuple[str, "pa.Schema", Iterator["pa.Table"]]]:
+        """Columnar exports as (name, schema, stream of tables)"""
+        snapshots = self.snapshots
+        personality_names = pa.array(PERSONALITY_NAMES, type=pa.string())
 
         # Snapshots
-        snapshot_data = [{
-            "tick": s.tick,
-            "timestamp": s.timestamp,
-            "total_agents": s.total_agents,
-            "total_wealth": s.total_wealth,
-            "avg_wealth": s.avg_wealth,
-            "wealth_gini": s.wealth_gini,
-            "items_listed": s.items_listed,
-            "items_sold": s.items_sold,
-        } for s in self.snapshots]
-        pd.DataFrame(snapshot_data).to_parquet(export_path / "snapshots.parquet")
-
-        # Agent states
-        agent_data = []
-        for s in self.snapshots:
-            for agent in s.agent_states:
-                agent_data.append({
-                    "tick": s.tick,
-                    **agent
-                })
-        pd.DataFrame(agent_data).to_parquet(export_path / "agent_states.parquet")
-
-        # Actions
-        action_data = [asdict(a) for a in self.action_logs]
-        for a in action_data:
-            a["action_params"] = json.dumps(a["action_params"])
-        pd.DataFrame(action_data).to_parquet(export_path / "actions.parquet")
+        snapshots_table = pa.table({
+            "tick": pa.array([s.tick for s in snapshots], type=pa.int64()),
+            "timestamp": pa.array([s.timestamp for s in snapshots], type=pa.string()),
+            "total_agents": pa.array([s.total_agents for s in snapshots], type=pa.int64()),
+            "total_wealth": pa.array([s.total_wealth for s in snapshots], type=pa.float64()),
+            "avg_wealth": pa.array([s.avg_wealth for s in snapshots], type=pa.float64()),
+            "wealth_gini": pa.array([s.wealth_gini for s in snapshots], type=pa.float64()),
+            "items_listed": pa.array([s.items_listed for s in snapshots], type=pa.int64()),
+            "items_sold": pa.array([s.items_sold for s in snapshots], type=pa.int64()),
+        })
+        yield "snapshots", snapshots_table.schema, iter([snapshots_table])
+
+        # Agent states, concatenated column-wise across ticks
+        def concat(column: str, dtype) -> np.ndarray:
+            arrays = [getattr(s, column) for s in snapshots]
+            return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+
+        personality_codes = pa.array(concat("personality_ids", np.int8), type=pa.int8())
+        agent_states_table = pa.table({
+            "tick": pa.array(np.repeat(
+                np.array([s.tick for s in snapshots], dtype=np.int64),
+                [s.agent_ids.size for s in snapshots],
+            )),
+            "id": pa.array(concat("agent_ids", object), type=pa.string()),
+            "name": pa.array(concat("agent_names", object), type=pa.string()),
+            "personality": pa.DictionaryArray.from_arrays(
+                personality_codes, personality_names
+            ),
+            "wealth": pa.array(concat("wealths", np.float64)),
+            "risk_tolerance": pa.array(concat("risk_tolerances", np.int32)),
+            "reputation": pa.array(concat("reputations", np.int32)),
+        })
+        yield "agent_states", agent_states_table.schema, iter([agent_states_table])
+
+        # Actions, streamed from the spill and buffer one table at a time
+        yield "actions", ACTION_EXPORT_SCHEMA, (
+            pa.table({
+                "tick": table["tick"],
+                "timestamp": table["timestamp"],
+                "agent_id": table["agent_id"],
+                "agent_name": table["agent_name"],
+                "personality": pa.DictionaryArray.from_arrays(
+                    table["personality_id"].combine_chunks().cast(pa.int32()), personality_names
+                ),
+                "action_type": table["action_type"].cast(CATEGORY),
+                "action_params": table["action_params_json"],
+                "reasoning": table["reasoning"],
+                "success": table["success"],
+                "wealth_before": table["wealth_before"],
+                "wealth_after": table["wealth_after"],
+            }, schema=ACTION_EXPORT_SCHEMA)
+            for table in self._log_tables(self.action_logs, self._action_spill, ACTION_LOG_SCHEMA)
+        )
 
         # Transactions
-        pd.DataFrame([asdict(t) for t in self.transaction_logs]).to_parquet(
-            export_path / "transactions.parquet"
+        yield "transactions", TRANSACTION_EXPORT_SCHEMA, (
+            table.cast(TRANSACTION_EXPORT_SCHEMA)
+            for table in self._log_tables(self.transaction_logs, self._transaction_spill, TRANSACTION_LOG_SCHEMA)
         )
 
+    def export_arrow(self) -> str:
+        """
+        Export to Arrow IPC streams (requires pyarrow).
+
+        This is the canonical columnar export: export_parquet converts these
+        files through a memory map instead of rebuilding every table.
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Arrow export")
+
+        export_path = self.output_dir / f"simulation_{self.simulation_id}_arrow"
+        export_path.mkdir(exist_ok=True)
+
+        # The stream format is used because dictionary-encoded columns may
+        # carry a different dictionary in each batch
+        for name, schema, tables in self._export_tables():
+            with pa.OSFile(str(export_path / f"{name}.arrow"), "wb") as sink:
+                with pa.ipc.new_stream(sink, schema) as writer:
+                    for table in tables:
+                        writer.write_table(table)
+
+        print(f"Exported Arrow to {export_path}")
+        return str(export_path)
+
+    def export_parquet(self, arrow_path: Optional[str] = None) -> str:
+        """Export to Parquet format (requires pyarrow), from arrow_path if given"""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for Parquet export")
+
+        export_path = self.output_dir / f"simulation_{self.simulation_id}_parquet"
+        export_path.mkdir(exist_ok=True)
+
+        if arrow_path is None:
+            for name, schema, tables in self._export_tables():
+                with pq.ParquetWriter(export_path / f"{name}.parquet", schema, **PARQUET_OPTIONS) as writer:
+                    for table in tables:
+                        writer.write_table(table)
+        else:
+            for ipc_file in sorted(Path(arrow_path).glob("*.arrow")):
+                with pa.memory_map(str(ipc_file)) as source:
+                    reader = pa.ipc.open_stream(source)
+                    with pq.ParquetWriter(export_path / f"{ipc_file.stem}.parquet", reader.schema, **PARQUET_OPTIONS) as writer:
+                        for batch in reader:
+                            writer.write_batch(batch)
+
         print(f"Exported Parquet to {export_path}")
         return str(export_path)
 
+    def _export_columnar(self) -> Dict[str, str]:
+        """Arrow IPC export followed by the Parquet files derived from it"""
+        arrow_path = self.export_arrow()
+        return {"arrow": arrow_path, "parquet": self.export_parquet(arrow_path=arrow_path)}
+
     def export_all(self) -> Dict[str, str]:
         """Export to all formats"""
         paths = {
@@ -516,11 +1018,31 @@ class DataExporter:
             "sqlite": self.export_sqlite(),
         }
 
-        if PANDAS_AVAILABLE:
-            paths["parquet"] = self.export_parquet()
+        if PYARROW_AVAILABLE:
+            paths.update(self._export_columnar())
 
         return paths
 
+    async def export_all_async(self) -> Dict[str, str]:
+        """Export to all formats, running the independent exporters concurrently in threads"""
+        # The threads read a frozen copy while the loop keeps logging
+        frozen = self.snapshot()
+
+        jobs = [
+            asyncio.to_thread(frozen.export_json),
+            asyncio.to_thread(frozen.export_csv),
+            asyncio.to_thread(frozen.export_sqlite),
+        ]
+        if PYARROW_AVAILABLE:
+            jobs.append(asyncio.to_thread(frozen._export_columnar))
+
+        json_path, csv_path, sqlite_path, *columnar = await asyncio.gather(*jobs)
+
+        paths = {"json": json_path, "csv": csv_path, "sqlite": sqlite_path}
+        for columnar_paths in columnar:
+            paths.update(columnar_paths)
+        return paths
+
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics"""
         if not self.snapshots:
@@ -529,26 +1051,30 @@ class DataExporter:
         first = self.snapshots[0]
         last = self.snapshots[-1]
 
-        # Wealth changes by personality
+        # Wealth changes by personality, for agents present in both snapshots
         personality_changes = {}
         if len(self.snapshots) >= 2:
-            first_agents = {a["id"]: a for a in first.agent_states}
-            last_agents = {a["id"]: a for a in last.agent_states}
-
-            for agent_id, first_state in first_agents.items():
-                if agent_id in last_agents:
-                    personality = first_state["personality"]
-                    change = last_agents[agent_id]["wealth"] - first_state["wealth"]
-
-                    if personality not in personality_changes:
-                        personality_changes[personality] = []
-                    personality_changes[personality].append(change)
+            _, first_idx, last_idx = np.intersect1d(
+                first.agent_ids.astype(str), last.agent_ids.astype(str), return_indices=True
+            )
+            changes = last.wealths[last_idx] - first.wealths[first_idx]
+            totals, counts = per_personality_delta_kernel(
+                first.personality_ids[first_idx], changes, len(PERSONALITIES)
+            )
+            averages = totals / np.maximum(counts, 1)
+            # Ids are translated back to personality names only here
+            for code in np.flatnonzero(counts).tolist():
+                personality_changes[PERSONALITY_NAMES[code]] = {
+                    "avg_change": float(averages[code]),
+                    "total_change": float(totals[code]),
+                    "count": int(counts[code]),
+                }
 
         return {
             "simulation_id": self.simulation_id,
             "total_ticks": len(self.snapshots),
-            "total_actions": len(self.action_logs),
-            "total_transactions": len(self.transaction_logs),
+            "total_actions": self.total_actions,
+            "total_transactions": self.total_transactions,
             "initial_state": {
                 "total_wealth": first.total_wealth,
                 "avg_wealth": first.avg_wealth,
@@ -559,21 +1085,10 @@ class DataExporter:
                 "avg_wealth": last.avg_wealth,
                 "gini": last.wealth_gini,
             },
-            "wealth_change_by_personality": {
-                p: {
-                    "avg_change": sum(changes) / len(changes),
-                    "total_change": sum(changes),
-                    "count": len(changes),
-                }
-                for p, changes in personality_changes.items()
-            },
+            "wealth_change_by_personality": personality_changes,
             "action_distribution": self._get_action_distribution(),
         }
 
     def _get_action_distribution(self) -> Dict[str, int]:
         """Get distribution of action types"""
-        distribution = {}
-        for action in self.action_logs:
-            action_type = action.action_type
-            distribution[action_type] = distribution.get(action_type, 0) + 1
-        return distribution
+        return dict(self._action_counts)
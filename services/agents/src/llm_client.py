@@ -4,29 +4,121 @@ Supports vLLM for high-performance inference on H100
 """
 
 import asyncio
+import hashlib
 import json
 import os
 import re
-from typing import Optional, Dict, Any, List
-from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import aclosing
+from itertools import groupby
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple, Protocol
 import httpx
+import orjson
+
+try:
+    from transformers import AutoTokenizer
+    TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    TRANSFORMERS_AVAILABLE = False
+
+
+# Responses longer than this are scanned for JSON off the event loop
+EXTRACT_OFFLOAD_CHARS = 100_000
+
+# Connection pool shared by every LLM client
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "512"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "256"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30.0"))
+
+# Batched /v1/completions requests for vLLM. The chat template is applied
+# client-side; the default is ChatML (Qwen and most instruct models).
+VLLM_BATCH_COMPLETIONS = os.getenv("VLLM_BATCH_COMPLETIONS", "false").lower() == "true"
+VLLM_CHAT_TEMPLATE = os.getenv(
+    "VLLM_CHAT_TEMPLATE",
+    "<|im_start|>system\n{system}<|im_end|>\n<|im_start|>user\n{prompt}<|im_end|>\n<|im_start|>assistant\n",
+)
+# Prompts per batched request, kept within vLLM's default max_num_seqs
+VLLM_MAX_BATCH_PROMPTS = 256
+# Send batched prompts as token ids, tokenized client-side with the model's
+# tokenizer; the templated system prompt prefix is tokenized once
+VLLM_PRETOKENIZE = os.getenv("VLLM_PRETOKENIZE", "false").lower() == "true"
+# Stream chat completions and stop reading once a complete JSON object
+# follows the chain-of-thought, which aborts the rest of the decode
+VLLM_STREAM = os.getenv("VLLM_STREAM", "false").lower() == "true"
+# Constrain vLLM output to the agent action schema. The model then emits a
+# bare JSON object with no chain-of-thought, so a short token budget suffices;
+# unconstrained output keeps room for thinking before the JSON.
+VLLM_GUIDED_JSON = os.getenv("VLLM_GUIDED_JSON", "true").lower() == "true"
+VLLM_GUIDED_MAX_TOKENS = 256
+VLLM_UNGUIDED_MAX_TOKENS = 2048
+# Explicit token budget; unset picks the default for the guided mode
+VLLM_MAX_TOKENS = int(os.getenv("VLLM_MAX_TOKENS", "0")) or None
+
+# Error-body markers of a server that cannot do schema-guided decoding
+GUIDED_JSON_ERROR_MARKERS = ("response_format", "json_schema", "guided")
+
+AGENT_ACTION_SCHEMA = {
+    "name": "agent_action",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "reasoning": {"type": "string"},
+            "action": {
+                "type": "string",
+                "enum": ["LIST_ITEM", "PURCHASE", "CREATE_CHANNEL", "POST_MESSAGE", "OBSERVE", "WAIT"],
+            },
+            "params": {"type": "object"},
+            "emotion": {"type": "string"},
+        },
+        "required": ["reasoning", "action", "params", "emotion"],
+        "additionalProperties": False,
+    },
+}
+
+# Concurrent in-flight requests per Anthropic client
+ANTHROPIC_CONCURRENCY = int(os.getenv("ANTHROPIC_CONCURRENCY", "8"))
+# Concurrent in-flight requests per Ollama client; match the server's
+# OLLAMA_NUM_PARALLEL so requests don't just queue server-side
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+# Exact-match response cache. Generation samples at temperature 0.7, so
+# replaying a cached response is opt-in.
+LLM_CACHE_STOCHASTIC = os.getenv("LLM_CACHE_STOCHASTIC", "0") == "1"
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "10000"))
+
+_SHARED_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Pooled client, created on first use"""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _SHARED_CLIENT
 
 
-def extract_json_from_response(response: str) -> str:
-    """
-    Extract JSON from LLM responses that may contain <think> tags or other text.
-    Handles Qwen3 and other models that output chain-of-thought before JSON.
-    """
-    # Remove <think>...</think> blocks (complete or incomplete)
-    response = re.sub(r'<think>.*?</think>', '', response, flags=re.DOTALL)
-    # Also remove unclosed <think> tags
-    response = re.sub(r'<think>.*$', '', response, flags=re.DOTALL)
+async def close_shared_client():
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
 
-    # Find the first { and try to extract balanced JSON
-    start_idx = response.find('{')
-    if start_idx == -1:
-        return response.strip()
 
+# <think>...</think> blocks, plus an unclosed <think> running to the end
+_THINK_RE = re.compile(r'<think>.*?</think>|<think>.*$', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_DECODER = json.JSONDecoder()
+
+
+def _scan_balanced_json(response: str, start_idx: int) -> str:
+    """Brace-matching scan from start_idx, for responses that aren't valid JSON"""
     # Count braces to find matching closing brace
     depth = 0
     in_string = False
@@ -49,18 +141,10 @@ def extract_json_from_response(response: str) -> str:
         elif char == '}':
             depth -= 1
             if depth == 0:
-                json_str = response[start_idx:i+1]
-                # Validate it's actual JSON
-                try:
-                    json.loads(json_str)
-                    return json_str
-                except json.JSONDecodeError:
-                    # Try to clean it up
-                    pass
-                return json_str
+                return response[start_idx:i+1]
 
     # If we couldn't find balanced braces, try regex as fallback
-    json_match = re.search(r'\{.*\}', response, flags=re.DOTALL)
+    json_match = _JSON_OBJECT_RE.search(response)
     if json_match:
         return json_match.group()
 
@@ -68,19 +152,128 @@ def extract_json_from_response(response: str) -> str:
     return response.strip()
 
 
-class LLMClient(ABC):
-    """Abstract base class for LLM clients"""
+def extract_json_from_response(response: str) -> str:
+    """
+    Extract JSON from LLM responses that may contain <think> tags or other text.
+    Handles Qwen3 and other models that output chain-of-thought before JSON.
+    """
+    # Fast path: a bare JSON object with no chain-of-thought needs no regex work
+    stripped = response.lstrip()
+    if stripped.startswith('{'):
+        try:
+            _, end_idx = _DECODER.raw_decode(stripped)
+            return stripped[:end_idx]
+        except json.JSONDecodeError:
+            pass
+
+    # Remove <think>...</think> blocks (complete or incomplete); the substring
+    # test skips the regex pass and the string copy when there are none
+    if '<think>' in response:
+        response = _THINK_RE.sub('', response)
+
+    # Find the first { and parse the object starting there
+    start_idx = response.find('{')
+    if start_idx == -1:
+        return response.strip()
+
+    try:
+        _, end_idx = _DECODER.raw_decode(response, start_idx)
+        return response[start_idx:end_idx]
+    except json.JSONDecodeError:
+        return _scan_balanced_json(response, start_idx)
+
+
+def has_complete_json(response: str) -> bool:
+    """Whether a (partial) response already contains a whole JSON object outside <think>"""
+    if '<think>' in response:
+        response = _THINK_RE.sub('', response)
+    start_idx = response.find('{')
+    if start_idx == -1:
+        return False
+    try:
+        _DECODER.raw_decode(response, start_idx)
+        return True
+    except json.JSONDecodeError:
+        return False
+
+
+async def extract_json_async(response: str) -> str:
+    """
+    extract_json_from_response without blocking the event loop on large
+    (chain-of-thought heavy) responses; small ones are handled inline.
+    """
+    if len(response) > EXTRACT_OFFLOAD_CHARS:
+        return await asyncio.to_thread(extract_json_from_response, response)
+    return extract_json_from_response(response)
+
+
+class ResponseCache:
+    """LRU of extracted responses keyed by a hash of the full request"""
+
+    def __init__(self, maxsize: int = LLM_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, str]" = OrderedDict()
+
+    @staticmethod
+    def key(model: str, system_prompt: str, prompt: str, max_tokens: int) -> bytes:
+        return hashlib.blake2b(
+            f"{model}|{system_prompt}|{prompt}|{max_tokens}".encode(), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: bytes, value: str):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class LLMClient(Protocol):
+    """Interface every LLM client provides"""
+
+    model: str
 
-    @abstractmethod
     async def generate(self, prompt: str, system_prompt: str, max_tokens: int = 1024) -> str:
-        pass
+        ...
 
-    @abstractmethod
     async def batch_generate(self, prompts: List[Dict[str, str]], max_tokens: int = 1024) -> List[str]:
-        pass
+        ...
+
+    def iter_generate(self, prompts: List[Dict[str, str]]) -> AsyncIterator[Tuple[int, str]]:
+        """Yield (prompt index, response) pairs as responses become available"""
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class _BaseLLMClient:
+    """Helpers shared by the concrete LLM clients"""
+
+    model: str
+    # Set on clients created with LLM_CACHE_STOCHASTIC enabled
+    cache: Optional[ResponseCache] = None
+
+    def _cache_key(self, prompt: str, system_prompt: str, max_tokens: int) -> Optional[bytes]:
+        if self.cache is None:
+            return None
+        return self.cache.key(self.model, system_prompt, prompt, max_tokens)
+
+    async def iter_generate(self, prompts: List[Dict[str, str]]) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Yield (prompt index, response) pairs as responses become available.
+        Clients without per-request concurrency yield the batch in order.
+        """
+        for item in enumerate(await self.batch_generate(prompts)):
+            yield item
 
 
-class VLLMClient(LLMClient):
+class VLLMClient(_BaseLLMClient):
     """
     vLLM client for high-performance inference on H100
     Supports continuous batching for 100+ concurrent agents
@@ -91,42 +284,74 @@ class VLLMClient(LLMClient):
         base_url: str = "http://localhost:8080",
         model: str = "meta-llama/Llama-3.1-70B-Instruct",
         timeout: float = 120.0,  # Increased timeout for large batches
-        max_tokens: int = 2048,  # Increased to allow thinking + JSON response
+        max_tokens: Optional[int] = VLLM_MAX_TOKENS,
+        batch_completions: bool = VLLM_BATCH_COMPLETIONS,
+        chat_template: str = VLLM_CHAT_TEMPLATE,
+        stream: bool = VLLM_STREAM,
+        guided_json: bool = VLLM_GUIDED_JSON,
+        pretokenize: bool = VLLM_PRETOKENIZE,
     ):
         self.base_url = base_url
         self.model = model
         self.timeout = timeout
+        # A default budget follows guided_json, including a fallback to unguided
+        self._default_max_tokens = max_tokens is None
+        if max_tokens is None:
+            max_tokens = VLLM_GUIDED_MAX_TOKENS if guided_json else VLLM_UNGUIDED_MAX_TOKENS
         self.max_tokens = max_tokens
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.batch_completions = batch_completions
+        self.chat_template = chat_template
+        self.stream = stream
+        self.guided_json = guided_json
+        self.client = get_shared_client()
+        self.tokenizer = None
+        if pretokenize and TRANSFORMERS_AVAILABLE:
+            try:
+                self.tokenizer = AutoTokenizer.from_pretrained(model)
+            except Exception as e:
+                print(f"[VLLMClient] Tokenizer unavailable, sending text prompts: {e}", flush=True)
+        self._template_head, self._template_tail = chat_template.split("{prompt}", 1)
+        self._prefix_ids: Dict[str, List[int]] = {}
+        if LLM_CACHE_STOCHASTIC:
+            self.cache = ResponseCache()
         print(f"[VLLMClient] Initialized with base_url={base_url}, model={model}, timeout={timeout}, max_tokens={max_tokens}", flush=True)
 
-    async def generate(self, prompt: str, system_prompt: str, max_tokens: int = None) -> str:
-        """Generate a single response"""
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int = None,
+        agent_id: Optional[str] = None,
+    ) -> str:
+        """Generate a single response, tagged with the requesting agent's id"""
         # Use instance max_tokens if not specified
         tokens = max_tokens if max_tokens is not None else self.max_tokens
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt}
-        ]
+        cache_key = self._cache_key(prompt, system_prompt, tokens)
+        if cache_key is not None and (cached := self.cache.get(cache_key)) is not None:
+            return cached
 
+        guided = self.guided_json
         try:
-            response = await self.client.post(
-                f"{self.base_url}/v1/chat/completions",
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "max_tokens": tokens,
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            content = data["choices"][0]["message"]["content"]
+            if self.stream:
+                content = await self._read_stream(prompt, system_prompt, tokens, agent_id)
+            else:
+                response = await self.client.post(
+                    f"{self.base_url}/v1/chat/completions",
+                    json=self._chat_body(prompt, system_prompt, tokens, agent_id=agent_id),
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                content = data["choices"][0]["message"]["content"]
             # Extract JSON from response (handles <think> tags from Qwen3)
-            return extract_json_from_response(content)
+            result = await extract_json_async(content)
+            if cache_key is not None:
+                self.cache.put(cache_key, result)
+            return result
         except Exception as e:
+            if guided and self._rejected_guided_json(e):
+                return await self.generate(prompt, system_prompt, max(tokens, self.max_tokens), agent_id)
             print(f"vLLM generation error: {e}")
             return json.dumps({
                 "reasoning": "Error generating response",
@@ -135,6 +360,126 @@ class VLLMClient(LLMClient):
                 "emotion": "confused"
             })
 
+    def _chat_body(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int,
+        stream: bool = False,
+        agent_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        body = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.7,
+            "top_p": 0.9,
+            "stream": stream,
+        }
+        if self.guided_json:
+            body["response_format"] = {"type": "json_schema", "json_schema": AGENT_ACTION_SCHEMA}
+        # Only the OpenAI "user" tag is set. A cache_salt would partition the
+        # prefix cache per agent and stop agents sharing the system prompt KV.
+        if agent_id:
+            body["user"] = agent_id
+        return body
+
+    def _prompt_tokens(self, p: Dict[str, Any], max_tokens: Optional[int]) -> int:
+        """
+        Token budget for one prompt dict. A per-prompt "max_tokens" sizes the
+        JSON answer; unguided output also carries thinking, so there it never
+        drops below the client's budget.
+        """
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        budget = p.get("max_tokens")
+        if budget is None:
+            return tokens
+        return budget if self.guided_json else max(budget, tokens)
+
+    def _rejected_guided_json(self, error: Exception) -> bool:
+        """
+        Whether a guided request failed because the server rejected
+        response_format. Guided decoding is then turned off for this client
+        so the request can be retried unguided. Other client errors, such as
+        a prompt over the context length, leave the client untouched.
+        """
+        if not isinstance(error, httpx.HTTPStatusError) or error.response.status_code not in (400, 422):
+            return False
+        try:
+            detail = error.response.text.lower()
+        except httpx.ResponseNotRead:
+            return False
+        if not any(marker in detail for marker in GUIDED_JSON_ERROR_MARKERS):
+            return False
+        if self.guided_json:
+            self.guided_json = False
+            if self._default_max_tokens:
+                self.max_tokens = VLLM_UNGUIDED_MAX_TOKENS
+            print(
+                f"[VLLMClient] Server rejected response_format ({error.response.status_code}), "
+                f"falling back to unguided generation with max_tokens={self.max_tokens}",
+                flush=True,
+            )
+        return True
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str,
+        max_tokens: int = None,
+        agent_id: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Yield content fragments of a streamed chat completion as they arrive"""
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        async with self.client.stream(
+            "POST",
+            f"{self.base_url}/v1/chat/completions",
+            json=self._chat_body(prompt, system_prompt, tokens, stream=True, agent_id=agent_id),
+            timeout=self.timeout,
+        ) as response:
+            if response.is_error:
+                # Read the error body so the guided-JSON fallback can inspect it
+                await response.aread()
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                # Server-sent events: "data: {...}" lines, ending with "data: [DONE]"
+                if not line.startswith("data: "):
+                    continue
+                payload = line[len("data: "):]
+                if payload == "[DONE]":
+                    break
+                fragment = orjson.loads(payload)["choices"][0]["delta"].get("content")
+                if fragment:
+                    yield fragment
+
+    async def _read_stream(self, prompt: str, system_prompt: str, max_tokens: int, agent_id: Optional[str]) -> str:
+        """Accumulate a streamed completion, hanging up once the JSON object is complete"""
+        parts = []
+        async with aclosing(self.generate_stream(prompt, system_prompt, max_tokens, agent_id)) as fragments:
+            async for fragment in fragments:
+                parts.append(fragment)
+                if "}" in fragment and has_complete_json("".join(parts)):
+                    break
+        return "".join(parts)
+
+    async def iter_generate(self, prompts: List[Dict[str, str]]) -> AsyncIterator[Tuple[int, str]]:
+        """Yield (prompt index, response) pairs in completion order"""
+        if self.batch_completions:
+            async for item in super().iter_generate(prompts):
+                yield item
+            return
+
+        async def indexed(index: int, p: Dict[str, str]) -> Tuple[int, str]:
+            return index, await self.generate(
+                p["prompt"], p["system_prompt"], self._prompt_tokens(p, None), p.get("agent_id")
+            )
+
+        for next_done in asyncio.as_completed([indexed(i, p) for i, p in enumerate(prompts)]):
+            yield await next_done
+
     async def batch_generate(
         self,
         prompts: List[Dict[str, str]],
@@ -144,37 +489,113 @@ class VLLMClient(LLMClient):
         Batch generate responses for multiple agents
         vLLM handles continuous batching automatically for optimal GPU utilization
         """
-        # Use instance max_tokens if not specified
-        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        if self.batch_completions:
+            # One max_tokens per request, so consecutive prompts sharing a
+            # budget are batched together
+            batches = []
+            for tokens, run in groupby(prompts, key=lambda p: self._prompt_tokens(p, max_tokens)):
+                run = list(run)
+                batches.extend(
+                    (run[i:i + VLLM_MAX_BATCH_PROMPTS], tokens)
+                    for i in range(0, len(run), VLLM_MAX_BATCH_PROMPTS)
+                )
+            results = await asyncio.gather(*(
+                self._generate_completions(batch, tokens) for batch, tokens in batches
+            ))
+            return [r for batch_results in results for r in batch_results]
+
         tasks = [
-            self.generate(p["prompt"], p["system_prompt"], tokens)
+            self.generate(p["prompt"], p["system_prompt"], self._prompt_tokens(p, max_tokens), p.get("agent_id"))
             for p in prompts
         ]
         return await asyncio.gather(*tasks)
 
+    async def _generate_completions(self, prompts: List[Dict[str, str]], max_tokens: Optional[int]) -> List[str]:
+        """Generate a whole batch with a single /v1/completions request"""
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        if self.tokenizer is not None:
+            batch_prompts = [self._encode(p["system_prompt"], p["prompt"]) for p in prompts]
+        else:
+            batch_prompts = [
+                self.chat_template.format(system=p["system_prompt"], prompt=p["prompt"])
+                for p in prompts
+            ]
+        body = {
+            "model": self.model,
+            "prompt": batch_prompts,
+            "max_tokens": tokens,
+            "temperature": 0.7,
+            "top_p": 0.9,
+        }
+        guided = self.guided_json
+        if guided:
+            body["response_format"] = {"type": "json_schema", "json_schema": AGENT_ACTION_SCHEMA}
+        try:
+            response = await self.client.post(
+                f"{self.base_url}/v1/completions",
+                json=body,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            choices = sorted(orjson.loads(response.content)["choices"], key=lambda c: c["index"])
+            return [await extract_json_async(c["text"]) for c in choices]
+        except Exception as e:
+            if guided and self._rejected_guided_json(e):
+                return await self._generate_completions(prompts, max(tokens, self.max_tokens))
+            print(f"vLLM batch generation error: {e}")
+            return [json.dumps({
+                "reasoning": "Error generating response",
+                "action": "WAIT",
+                "params": {},
+                "emotion": "confused"
+            })] * len(prompts)
+
+    def _encode(self, system_prompt: str, prompt: str) -> List[int]:
+        """Token ids for a templated prompt, reusing the ids of the system prefix"""
+        prefix = self._prefix_ids.get(system_prompt)
+        if prefix is None:
+            prefix = self.tokenizer.encode(
+                self._template_head.format(system=system_prompt), add_special_tokens=False
+            )
+            self._prefix_ids[system_prompt] = prefix
+        return prefix + self.tokenizer.encode(prompt + self._template_tail, add_special_tokens=False)
+
     async def close(self):
-        await self.client.aclose()
+        await close_shared_client()
 
 
-class OllamaClient(LLMClient):
+class OllamaClient(_BaseLLMClient):
     """
     Ollama client for local development on MacBook
     Uses smaller models like Llama 3 8B or Mistral 7B
+
+    The Ollama server handles OLLAMA_NUM_PARALLEL requests per loaded model
+    concurrently (and keeps up to OLLAMA_MAX_LOADED_MODELS models resident).
+    batch_generate keeps that many requests in flight; set the same
+    OLLAMA_NUM_PARALLEL value for this service and the server.
     """
 
     def __init__(
         self,
         base_url: str = "http://localhost:11434",
         model: str = "llama3.1:8b",
-        timeout: float = 120.0
+        timeout: float = 120.0,
+        concurrency: int = OLLAMA_NUM_PARALLEL,
     ):
         self.base_url = base_url
         self.model = model
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.client = get_shared_client()
+        if LLM_CACHE_STOCHASTIC:
+            self.cache = ResponseCache()
 
     async def generate(self, prompt: str, system_prompt: str, max_tokens: int = 1024) -> str:
         """Generate using Ollama API"""
+        cache_key = self._cache_key(prompt, system_prompt, max_tokens)
+        if cache_key is not None and (cached := self.cache.get(cache_key)) is not None:
+            return cached
+
         try:
             response = await self.client.post(
                 f"{self.base_url}/api/chat",
@@ -189,11 +610,15 @@ class OllamaClient(LLMClient):
                         "num_predict": max_tokens,
                         "temperature": 0.7,
                     }
-                }
+                },
+                timeout=self.timeout,
             )
             response.raise_for_status()
-            data = response.json()
-            return data["message"]["content"]
+            data = orjson.loads(response.content)
+            result = await extract_json_async(data["message"]["content"])
+            if cache_key is not None:
+                self.cache.put(cache_key, result)
+            return result
         except Exception as e:
             print(f"Ollama generation error: {e}")
             return json.dumps({
@@ -208,20 +633,20 @@ class OllamaClient(LLMClient):
         prompts: List[Dict[str, str]],
         max_tokens: int = 1024
     ) -> List[str]:
-        """Batch generate (sequential for Ollama, parallel for vLLM)"""
-        # Ollama doesn't support true batching, so we run sequentially
-        # For production with many agents, use vLLM instead
-        results = []
-        for p in prompts:
-            result = await self.generate(p["prompt"], p["system_prompt"], max_tokens)
-            results.append(result)
-        return results
+        """Batch generate with at most OLLAMA_NUM_PARALLEL requests in flight"""
+        # Ollama doesn't support true batching; for production with many
+        # agents, use vLLM instead
+        async def generate_limited(p: Dict[str, str]) -> str:
+            async with self._semaphore:
+                return await self.generate(p["prompt"], p["system_prompt"], max_tokens)
+
+        return await asyncio.gather(*(generate_limited(p) for p in prompts))
 
     async def close(self):
-        await self.client.aclose()
+        await close_shared_client()
 
 
-class AnthropicClient(LLMClient):
+class AnthropicClient(_BaseLLMClient):
     """
     Claude API client for high-quality reasoning
     Good for complex negotiations and strategy
@@ -231,23 +656,29 @@ class AnthropicClient(LLMClient):
         self,
         api_key: Optional[str] = None,
         model: str = "claude-sonnet-4-20250514",
-        timeout: float = 60.0
+        timeout: float = 60.0,
+        concurrency: int = ANTHROPIC_CONCURRENCY,
     ):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
         self.timeout = timeout
-        self.client = httpx.AsyncClient(
-            timeout=timeout,
-            headers={
-                "x-api-key": self.api_key,
-                "content-type": "application/json",
-                "anthropic-version": "2023-06-01"
-            }
-        )
+        self._semaphore = asyncio.Semaphore(concurrency)
+        if LLM_CACHE_STOCHASTIC:
+            self.cache = ResponseCache()
+        self.client = get_shared_client()
+        self.headers = {
+            "x-api-key": self.api_key,
+            "content-type": "application/json",
+            "anthropic-version": "2023-06-01"
+        }
         self.base_url = "https://api.anthropic.com/v1"
 
     async def generate(self, prompt: str, system_prompt: str, max_tokens: int = 1024) -> str:
         """Generate using Claude API"""
+        cache_key = self._cache_key(prompt, system_prompt, max_tokens)
+        if cache_key is not None and (cached := self.cache.get(cache_key)) is not None:
+            return cached
+
         try:
             response = await self.client.post(
                 f"{self.base_url}/messages",
@@ -258,11 +689,16 @@ class AnthropicClient(LLMClient):
                     "messages": [
                         {"role": "user", "content": prompt}
                     ]
-                }
+                },
+                headers=self.headers,
+                timeout=self.timeout,
             )
             response.raise_for_status()
-            data = response.json()
-            return data["content"][0]["text"]
+            data = orjson.loads(response.content)
+            result = await extract_json_async(data["content"][0]["text"])
+            if cache_key is not None:
+                self.cache.put(cache_key, result)
+            return result
         except Exception as e:
             print(f"Anthropic generation error: {e}")
             return json.dumps({
@@ -277,21 +713,15 @@ class AnthropicClient(LLMClient):
         prompts: List[Dict[str, str]],
         max_tokens: int = 1024
     ) -> List[str]:
-        """Batch generate with rate limiting for API"""
-        tasks = [
-            self.generate(p["prompt"], p["system_prompt"], max_tokens)
-            for p in prompts
-        ]
-        # Add small delay between requests to respect rate limits
-        results = []
-        for task in tasks:
-            result = await task
-            results.append(result)
-            await asyncio.sleep(0.1)  # 100ms between requests
-        return results
+        """Batch generate with a bounded number of requests in flight"""
+        async def generate_limited(p: Dict[str, str]) -> str:
+            async with self._semaphore:
+                return await self.generate(p["prompt"], p["system_prompt"], max_tokens)
+
+        return await asyncio.gather(*(generate_limited(p) for p in prompts))
 
     async def close(self):
-        await self.client.aclose()
+        await close_shared_client()
 
 
 def get_llm_client(provider: str = "vllm", **kwargs) -> LLMClient:
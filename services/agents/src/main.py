@@ -5,15 +5,20 @@ FastAPI service for managing AI agents in the capitalism simulation
 
 import asyncio
 import os
+from itertools import islice
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
+import numpy as np
 
 from .orchestrator import AgentOrchestrator
 from .agent import AgentPersonality
+from .data_exporter import PERSONALITY_CODES, PERSONALITY_NAMES
 
 
 # Configuration from environment
@@ -23,6 +28,9 @@ LLM_BASE_URL = os.getenv("LLM_BASE_URL", "http://localhost:11434")
 LLM_MODEL = os.getenv("LLM_MODEL", "llama3.1:8b")
 BATCH_SIZE = int(os.getenv("BATCH_SIZE", "10"))
 
+# Request personality names to enum members
+PERSONALITY_MAP = MappingProxyType({p.value: p for p in AgentPersonality})
+
 # Global orchestrator instance
 orchestrator: Optional[AgentOrchestrator] = None
 
@@ -57,6 +65,7 @@ app = FastAPI(
     description="Manages AI agents for the Capitalism Simulation",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -95,6 +104,11 @@ class AgentResponse(BaseModel):
     reputation: int
 
 
+class ExportFileResponse(FileResponse):
+    """FileResponse that reads exports in 1 MiB chunks instead of 64 KiB"""
+    chunk_size = 1024 * 1024
+
+
 # Background task for simulation
 simulation_task: Optional[asyncio.Task] = None
 
@@ -122,16 +136,7 @@ async def root():
 @app.post("/agents", response_model=AgentResponse)
 async def create_agent(request: CreateAgentRequest):
     """Create a single AI agent"""
-    personality_map = {
-        "aggressive_trader": AgentPersonality.AGGRESSIVE_TRADER,
-        "conservative_investor": AgentPersonality.CONSERVATIVE_INVESTOR,
-        "market_maker": AgentPersonality.MARKET_MAKER,
-        "opportunist": AgentPersonality.OPPORTUNIST,
-        "philosopher": AgentPersonality.PHILOSOPHER,
-        "innovator": AgentPersonality.INNOVATOR,
-    }
-
-    personality = personality_map.get(request.personality, AgentPersonality.OPPORTUNIST)
+    personality = PERSONALITY_MAP.get(request.personality, AgentPersonality.OPPORTUNIST)
 
     agent = await orchestrator.create_agent(
         name=request.name,
@@ -156,21 +161,12 @@ async def create_agent(request: CreateAgentRequest):
 @app.post("/agents/population")
 async def create_population(request: CreatePopulationRequest):
     """Create a population of AI agents"""
-    personality_map = {
-        "aggressive_trader": AgentPersonality.AGGRESSIVE_TRADER,
-        "conservative_investor": AgentPersonality.CONSERVATIVE_INVESTOR,
-        "market_maker": AgentPersonality.MARKET_MAKER,
-        "opportunist": AgentPersonality.OPPORTUNIST,
-        "philosopher": AgentPersonality.PHILOSOPHER,
-        "innovator": AgentPersonality.INNOVATOR,
-    }
-
     distribution = None
     if request.personality_distribution:
         distribution = {
-            personality_map[k]: v
+            PERSONALITY_MAP[k]: v
             for k, v in request.personality_distribution.items()
-            if k in personality_map
+            if k in PERSONALITY_MAP
         }
 
     agents = await orchestrator.create_agent_population(
@@ -191,20 +187,30 @@ async def create_population(request: CreatePopulationRequest):
 @app.get("/agents")
 async def list_agents():
     """List all agents"""
-    return {
+    # Returned as a response directly so FastAPI skips jsonable_encoder;
+    # orjson writes the personality enum as its value without a Python lookup
+    return ORJSONResponse({
         "count": len(orchestrator.agents),
         "agents": [
-            AgentResponse(
-                id=a.id,
-                name=a.name,
-                personality=a.personality.value,
-                wealth=a.wealth,
-                risk_tolerance=a.risk_tolerance,
-                reputation=a.reputation,
-            )
+            {
+                "id": a.id,
+                "name": a.name,
+                "personality": a.personality,
+                "wealth": a.wealth,
+                "risk_tolerance": a.risk_tolerance,
+                "reputation": a.reputation,
+            }
             for a in orchestrator.agents.values()
         ]
-    }
+    })
+
+
+def recent_actions(agent, count: int) -> List[Dict[str, Any]]:
+    """Last `count` actions from the agent's bounded action deque"""
+    actions = agent.memory.recent_actions
+    if not actions:
+        return []
+    return list(islice(actions, max(len(actions) - count, 0), None))
 
 
 @app.get("/agents/{agent_id}")
@@ -222,9 +228,9 @@ async def get_agent(agent_id: str):
         "risk_tolerance": agent.risk_tolerance,
         "reputation": agent.reputation,
         "memory": {
-            "recent_actions": agent.memory.recent_actions[-10:],
-            "transaction_count": len(agent.memory.past_transactions),
-            "known_agents": len(agent.memory.known_agents),
+            "recent_actions": recent_actions(agent, 10),
+            "transaction_count": agent.memory.transaction_count,
+            "known_agents": len(agent.memory.known_agents or ()),
         }
     }
 
@@ -277,33 +283,36 @@ async def simulation_stats():
     if not orchestrator.agents:
         return {"error": "No agents in simulation"}
 
-    wealths = [a.wealth for a in orchestrator.agents.values()]
+    # Single pass over agents filling wealth and personality-code columns
+    n = len(orchestrator.agents)
+    wealths = np.empty(n, dtype=np.float64)
+    codes = np.empty(n, dtype=np.int8)
+    for i, agent in enumerate(orchestrator.agents.values()):
+        wealths[i] = agent.wealth
+        codes[i] = PERSONALITY_CODES[agent.personality]
 
-    by_personality = {}
-    for agent in orchestrator.agents.values():
-        p = agent.personality.value
-        if p not in by_personality:
-            by_personality[p] = []
-        by_personality[p].append(agent.wealth)
+    total = float(wealths.sum())
+    counts = np.bincount(codes, minlength=len(PERSONALITY_NAMES))
+    totals = np.bincount(codes, weights=wealths, minlength=len(PERSONALITY_NAMES))
 
-    return {
-        "total_agents": len(orchestrator.agents),
+    return ORJSONResponse({
+        "total_agents": n,
         "current_tick": orchestrator.market_state.tick,
         "wealth": {
-            "total": sum(wealths),
-            "average": sum(wealths) / len(wealths),
-            "max": max(wealths),
-            "min": min(wealths),
+            "total": total,
+            "average": total / n,
+            "max": float(wealths.max()),
+            "min": float(wealths.min()),
         },
         "by_personality": {
-            p: {
-                "count": len(w),
-                "average_wealth": sum(w) / len(w),
-                "total_wealth": sum(w),
+            PERSONALITY_NAMES[code]: {
+                "count": int(counts[code]),
+                "average_wealth": float(totals[code] / counts[code]),
+                "total_wealth": float(totals[code]),
             }
-            for p, w in by_personality.items()
+            for code in np.flatnonzero(counts).tolist()
         }
-    }
+    })
 
 
 @app.post("/tick")
@@ -331,10 +340,10 @@ async def export_summary():
 
 
 @app.post("/export/json")
-async def export_json():
-    """Export all simulation data to JSON"""
+async def export_json(indent: bool = False):
+    """Export all simulation data to JSON (pretty-printed if indent is set)"""
     try:
-        path = orchestrator.data_exporter.export_json()
+        path = await orchestrator.data_exporter.export_json_async(indent=indent)
         return {"status": "success", "path": path, "format": "json"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -344,7 +353,7 @@ async def export_json():
 async def export_csv():
     """Export all simulation data to CSV"""
     try:
-        path = orchestrator.data_exporter.export_csv()
+        path = await asyncio.to_thread(orchestrator.data_exporter.snapshot().export_csv)
         return {"status": "success", "path": path, "format": "csv"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -354,7 +363,7 @@ async def export_csv():
 async def export_sqlite():
     """Export all simulation data to SQLite database"""
     try:
-        path = orchestrator.data_exporter.export_sqlite()
+        path = await asyncio.to_thread(orchestrator.data_exporter.snapshot().export_sqlite)
         return {"status": "success", "path": path, "format": "sqlite"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -364,17 +373,27 @@ async def export_sqlite():
 async def export_parquet():
     """Export all simulation data to Parquet format"""
     try:
-        path = orchestrator.data_exporter.export_parquet()
+        path = await asyncio.to_thread(orchestrator.data_exporter.snapshot().export_parquet)
         return {"status": "success", "path": path, "format": "parquet"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/export/arrow")
+async def export_arrow():
+    """Export all simulation data to Arrow IPC streams"""
+    try:
+        path = await asyncio.to_thread(orchestrator.data_exporter.snapshot().export_arrow)
+        return {"status": "success", "path": path, "format": "arrow"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/export/all")
 async def export_all():
     """Export all simulation data to all formats"""
     try:
-        paths = orchestrator.data_exporter.export_all()
+        paths = await orchestrator.data_exporter.export_all_async()
         return {"status": "success", "paths": paths}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -383,9 +402,6 @@ async def export_all():
 @app.get("/export/download/{format}")
 async def download_export(format: str):
     """Download exported data (returns file path for now)"""
-    from fastapi.responses import FileResponse
-    import os
-
     sim_id = orchestrator.data_exporter.simulation_id
     base_path = orchestrator.data_exporter.output_dir
 
@@ -401,7 +417,7 @@ async def download_export(format: str):
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Export not found. Run export first.")
 
-    return FileResponse(
+    return ExportFileResponse(
         path=str(file_path),
         filename=file_path.name,
         media_type="application/octet-stream"
@@ -9,45 +9,98 @@ Handles:
 """
 
 import asyncio
-import json
+import functools
+import logging
+import os
 import random
 import sys
 import traceback
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 import httpx
+import numpy as np
+import orjson
 
-from .agent import Agent, AgentPersonality, AgentAction
+from .agent import Agent, AgentPersonality, AgentAction, ActionPool, shared_market_state_json
 from .llm_client import LLMClient, get_llm_client
-from .data_exporter import DataExporter
+from .data_exporter import DataExporter, PERSONALITY_CODES, PERSONALITY_NAMES
+
+
+# Connection pool for gateway requests
+GATEWAY_MAX_CONNECTIONS = 256
+GATEWAY_MAX_KEEPALIVE = 128
+GATEWAY_KEEPALIVE_EXPIRY = 60.0
+# Concurrent registrations when creating an agent population
+AGENT_CREATION_CONCURRENCY = 16
+# Concurrent gateway calls when executing a tick's actions
+ACTION_CONCURRENCY = 32
+
+# Rough response length per personality, in tokens. Longer decodes are
+# submitted first so they don't start last and set the batch's tail latency,
+# and each prompt's decode is capped at its estimate.
+EXPECTED_RESPONSE_TOKENS = {
+    AgentPersonality.PHILOSOPHER: 400,
+    AgentPersonality.INNOVATOR: 300,
+    AgentPersonality.MARKET_MAKER: 250,
+    AgentPersonality.AGGRESSIVE_TRADER: 200,
+    AgentPersonality.OPPORTUNIST: 200,
+    AgentPersonality.CONSERVATIVE_INVESTOR: 150,
+}
+
+# Actions that need no gateway call
+PASSIVE_ACTIONS = frozenset({"OBSERVE", "WAIT"})
+
+# Gateway path and request body builder for each action that posts to the API
+ACTION_ENDPOINTS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Any]]] = {
+    "LIST_ITEM": ("/marketplace/item", lambda params: params),
+    "PURCHASE": ("/marketplace/purchase", lambda params: {"itemId": params.get("itemId")}),
+    "CREATE_CHANNEL": ("/discourse/channel", lambda params: params),
+    "POST_MESSAGE": ("/discourse/post", lambda params: params),
+}
+
+
+# Timestamped stdout logger; the handler flushes once per record
+logger = logging.getLogger("agents.orchestrator")
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+    logger.addHandler(_handler)
+    logger.propagate = False
+logger.setLevel(os.getenv("AGENT_LOG_LEVEL", "INFO").upper())
 
 
 def log(message: str):
-    """Print with timestamp and immediate flush"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    print(f"[{timestamp}] {message}", flush=True)
-    sys.stdout.flush()
+    """Log with timestamp"""
+    logger.info(message)
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketState:
     """Current state of the market"""
     tick: int = 0
     items: List[Dict[str, Any]] = field(default_factory=list)
+    available_count: int = 0  # Items with status "available", kept in step with items
     channels: List[Dict[str, Any]] = field(default_factory=list)
     recent_transactions: List[Dict[str, Any]] = field(default_factory=list)
     timestamp: str = ""
+    # to_dict() projection and the tick it was built for; the state only
+    # changes when fetch_market_state advances the tick
+    _dict_cache: Optional[Tuple[int, Dict[str, Any]]] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        if self._dict_cache is not None and self._dict_cache[0] == self.tick:
+            return self._dict_cache[1]
+        projection = {
             "tick": self.tick,
-            "available_items": len([i for i in self.items if i.get("status") == "available"]),
+            "available_items": self.available_count,
             "items": self.items[:20],  # Limit to prevent context overflow
             "channels": self.channels[:10],
             "recent_transactions": self.recent_transactions[-10:],
             "timestamp": self.timestamp
         }
+        self._dict_cache = (self.tick, projection)
+        return projection
 
 
 class AgentOrchestrator:
@@ -60,24 +113,52 @@ class AgentOrchestrator:
         gateway_url: str = "http://localhost:8000",
         llm_provider: str = "vllm",
         llm_config: Optional[Dict[str, Any]] = None,
-        batch_size: int = 20,  # Number of agents to process in parallel
+        batch_size: int = 20,  # Number of agents per LLM batch; batches run concurrently
     ):
         self.gateway_url = gateway_url
         self.agents: Dict[str, Agent] = {}
+        # Agents in submission order, rebuilt only after the population changes
+        self._agent_list_cache: Optional[List[Agent]] = None
         self.llm_client: Optional[LLMClient] = None
         self.llm_provider = llm_provider
         self.llm_config = llm_config or {}
         self.batch_size = batch_size
         self.market_state = MarketState()
+        self.action_pool = ActionPool()
         self.http_client: Optional[httpx.AsyncClient] = None
+        # Gateway request counters for the current tick, kept by the
+        # client's event hooks
+        self._gateway_in_flight = 0
+        self._gateway_peak_in_flight = 0
+        self._gateway_responses = 0
         self.running = False
         self.tick_interval = 5.0  # Seconds between market ticks
         self.data_exporter = DataExporter()
+        # Action logging is queued and drained by a background task so it
+        # stays off the tick's awaited path
+        self._export_queue: Optional[asyncio.Queue] = None
+        self._export_task: Optional[asyncio.Task] = None
 
     async def start(self):
         """Initialize the orchestrator"""
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # One pooled client for every gateway call; requests use paths
+        # relative to the gateway so connections are reused across ticks
+        self.http_client = httpx.AsyncClient(
+            base_url=self.gateway_url,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=GATEWAY_MAX_CONNECTIONS,
+                max_keepalive_connections=GATEWAY_MAX_KEEPALIVE,
+                keepalive_expiry=GATEWAY_KEEPALIVE_EXPIRY,
+            ),
+            event_hooks={
+                "request": [self._on_gateway_request],
+                "response": [self._on_gateway_response],
+            },
+        )
         self.llm_client = get_llm_client(self.llm_provider, **self.llm_config)
+        self._export_queue = asyncio.Queue()
+        self._export_task = asyncio.create_task(self._drain_exports())
         self.running = True
         log(f"Orchestrator started with {self.llm_provider} LLM")
         log(f"LLM config: {self.llm_config}")
@@ -85,12 +166,47 @@ class AgentOrchestrator:
     async def stop(self):
         """Shutdown the orchestrator"""
         self.running = False
+        if self._export_task:
+            await self.flush_exports()
+            self._export_task.cancel()
         if self.http_client:
             await self.http_client.aclose()
         if self.llm_client:
             await self.llm_client.close()
         log("Orchestrator stopped")
 
+    async def _on_gateway_request(self, request: httpx.Request):
+        self._gateway_in_flight += 1
+        if self._gateway_in_flight > self._gateway_peak_in_flight:
+            self._gateway_peak_in_flight = self._gateway_in_flight
+
+    async def _on_gateway_response(self, response: httpx.Response):
+        self._gateway_in_flight -= 1
+        self._gateway_responses += 1
+
+    async def _drain_exports(self):
+        """Run queued data export calls in order"""
+        while True:
+            export = await self._export_queue.get()
+            try:
+                export()
+            except Exception as e:
+                log(f"Error logging export data: {e}")
+            finally:
+                self._export_queue.task_done()
+
+    def _queue_export(self, export: Callable[..., Any], *args, **kwargs):
+        """Queue a data exporter call, or run it inline if the drain task isn't running"""
+        if self._export_queue is None:
+            export(*args, **kwargs)
+        else:
+            self._export_queue.put_nowait(functools.partial(export, *args, **kwargs))
+
+    async def flush_exports(self):
+        """Wait until every queued export call has run"""
+        if self._export_queue is not None:
+            await self._export_queue.join()
+
     async def create_agent(
         self,
         name: str,
@@ -111,7 +227,7 @@ class AgentOrchestrator:
         try:
             # Register
             response = await self.http_client.post(
-                f"{self.gateway_url}/auth/register",
+                "/auth/register",
                 json={"username": name, "password": password}
             )
 
@@ -123,11 +239,11 @@ class AgentOrchestrator:
 
             # Login to get token
             response = await self.http_client.post(
-                f"{self.gateway_url}/auth/login",
+                "/auth/login",
                 json={"username": name, "password": password}
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             agent.api_token = data["token"]
 
         except Exception as e:
@@ -135,6 +251,7 @@ class AgentOrchestrator:
             return None
 
         self.agents[agent.id] = agent
+        self._agent_list_cache = None
         log(f"Created agent: {name} ({personality.value})")
         return agent
 
@@ -155,35 +272,37 @@ class AgentOrchestrator:
                 AgentPersonality.INNOVATOR: 0.15,    # Increased from 0.1
             }
 
-        agents = []
-        for i in range(count):
-            # Select personality based on distribution
-            r = random.random()
-            cumulative = 0
-            personality = AgentPersonality.OPPORTUNIST
-            for p, prob in personality_distribution.items():
-                cumulative += prob
-                if r <= cumulative:
-                    personality = p
-                    break
-
-            # Vary initial wealth and risk tolerance
-            initial_wealth = random.gauss(10000, 3000)
-            initial_wealth = max(1000, initial_wealth)  # Minimum $1000
-
-            risk_tolerance = random.randint(20, 80)
-
-            agent = await self.create_agent(
-                name=f"Agent_{i:03d}",
-                personality=personality,
-                initial_wealth=initial_wealth,
-                risk_tolerance=risk_tolerance
-            )
-            if agent:
-                agents.append(agent)
+        # Draw every agent's traits up front so the random sequence doesn't
+        # depend on the order registrations complete in
+        personalities = list(personality_distribution)
+        weights = list(personality_distribution.values())
+        # Probability mass the distribution leaves unassigned goes to opportunists
+        remainder = 1 - sum(weights)
+        if remainder > 0:
+            personalities.append(AgentPersonality.OPPORTUNIST)
+            weights.append(remainder)
+        chosen = random.choices(personalities, weights=weights, k=count)
+
+        # Vary initial wealth (minimum $1000) and risk tolerance
+        specs = [
+            (f"Agent_{i:03d}", personality, max(1000, random.gauss(10000, 3000)), random.randint(20, 80))
+            for i, personality in enumerate(chosen)
+        ]
+
+        # Register concurrently, capped to avoid overwhelming the auth system
+        semaphore = asyncio.Semaphore(AGENT_CREATION_CONCURRENCY)
+
+        async def create_limited(name, personality, initial_wealth, risk_tolerance):
+            async with semaphore:
+                return await self.create_agent(
+                    name=name,
+                    personality=personality,
+                    initial_wealth=initial_wealth,
+                    risk_tolerance=risk_tolerance
+                )
 
-            # Small delay to avoid overwhelming the auth system
-            await asyncio.sleep(0.05)
+        created = await asyncio.gather(*(create_limited(*spec) for spec in specs))
+        agents = [agent for agent in created if agent]
 
         log(f"Created {len(agents)} agents")
         return agents
@@ -191,54 +310,54 @@ class AgentOrchestrator:
     async def fetch_market_state(self) -> MarketState:
         """Fetch current market state from services"""
         # Get a valid token from any agent
-        token = None
+        headers = None
         for agent in self.agents.values():
             if agent.api_token:
-                token = agent.api_token
+                headers = agent.get_auth_headers()
                 break
 
-        if not token:
+        if not headers:
             log("No valid agent tokens available")
             return self.market_state
 
-        headers = {"Authorization": f"Bearer {token}"}
-
         try:
-            # Fetch marketplace items
-            items_response = await self.http_client.get(
-                f"{self.gateway_url}/marketplace/list",
-                headers=headers
-            )
-            items_data = items_response.json() if items_response.status_code == 200 else {"items": []}
-
-            # Fetch discourse channels
-            channels_response = await self.http_client.get(
-                f"{self.gateway_url}/discourse/channels",
-                headers=headers
+            # Fetch marketplace items and discourse channels concurrently
+            items_response, channels_response = await asyncio.gather(
+                self.http_client.get("/marketplace/list", headers=headers),
+                self.http_client.get("/discourse/channels", headers=headers),
             )
-            channels_data = channels_response.json() if channels_response.status_code == 200 else {"channels": []}
+            items_data = orjson.loads(items_response.content) if items_response.status_code == 200 else {"items": []}
+            channels_data = orjson.loads(channels_response.content) if channels_response.status_code == 200 else {"channels": []}
 
             # Fetch recent posts from top 3 channels so agents can see discussions
             channels_list = channels_data.get("channels", [])
-            for channel in channels_list[:3]:  # Only fetch from first 3 channels
+            top_channels = channels_list[:3]  # Only fetch from first 3 channels
+            details = await asyncio.gather(
+                *(
+                    self.http_client.get(f"/discourse/channel/{channel['id']}", headers=headers)
+                    for channel in top_channels
+                ),
+                return_exceptions=True,
+            )
+            for channel, channel_detail in zip(top_channels, details):
+                # Skip channels whose details failed to fetch
+                if isinstance(channel_detail, Exception) or channel_detail.status_code != 200:
+                    continue
                 try:
-                    channel_detail = await self.http_client.get(
-                        f"{self.gateway_url}/discourse/channel/{channel['id']}",
-                        headers=headers
-                    )
-                    if channel_detail.status_code == 200:
-                        detail_data = channel_detail.json()
-                        # Add recent posts to channel data (limit to 5 most recent)
-                        channel["recent_posts"] = detail_data.get("posts", [])[:5]
+                    detail_data = orjson.loads(channel_detail.content)
                 except Exception:
-                    pass  # Skip if fetching channel details fails
-
-            self.market_state = MarketState(
-                tick=self.market_state.tick + 1,
-                items=items_data.get("items", []),
-                channels=channels_list,
-                timestamp=datetime.now().isoformat()
-            )
+                    continue
+                # Add recent posts to channel data (limit to 5 most recent)
+                channel["recent_posts"] = detail_data.get("posts", [])[:5]
+
+            # Update the market state in place rather than allocating a new one
+            state = self.market_state
+            state.tick += 1
+            state.items = items_data.get("items", [])
+            state.available_count = sum(1 for i in state.items if i.get("status") == "available")
+            state.channels = channels_list
+            state.recent_transactions.clear()
+            state.timestamp = datetime.now().isoformat()
 
         except Exception as e:
             log(f"Error fetching market state: {e}")
@@ -251,53 +370,28 @@ class AgentOrchestrator:
         if not agent.api_token:
             return False
 
-        headers = {
-            "Authorization": f"Bearer {agent.api_token}",
-            "Content-Type": "application/json"
-        }
-
-        try:
-            if action.action_type == "LIST_ITEM":
-                response = await self.http_client.post(
-                    f"{self.gateway_url}/marketplace/item",
-                    headers=headers,
-                    json=action.params
-                )
+        if action.action_type in PASSIVE_ACTIONS:
+            return True  # No API call needed
 
-            elif action.action_type == "PURCHASE":
-                response = await self.http_client.post(
-                    f"{self.gateway_url}/marketplace/purchase",
-                    headers=headers,
-                    json={"itemId": action.params.get("itemId")}
-                )
-                if response.status_code == 200:
-                    # Update agent wealth
-                    item_price = action.params.get("price", 0)
-                    agent.wealth -= item_price
-
-            elif action.action_type == "CREATE_CHANNEL":
-                response = await self.http_client.post(
-                    f"{self.gateway_url}/discourse/channel",
-                    headers=headers,
-                    json=action.params
-                )
-
-            elif action.action_type == "POST_MESSAGE":
-                response = await self.http_client.post(
-                    f"{self.gateway_url}/discourse/post",
-                    headers=headers,
-                    json=action.params
-                )
-
-            elif action.action_type in ["OBSERVE", "WAIT"]:
-                return True  # No API call needed
+        endpoint = ACTION_ENDPOINTS.get(action.action_type)
+        if endpoint is None:
+            log(f"Unknown action type: {action.action_type}")
+            return False
+        path, build_body = endpoint
 
-            else:
-                log(f"Unknown action type: {action.action_type}")
-                return False
+        try:
+            response = await self.http_client.post(
+                path,
+                headers=agent.get_auth_headers(),
+                json=build_body(action.params)
+            )
+            if action.action_type == "PURCHASE" and response.status_code == 200:
+                # Update agent wealth
+                item_price = action.params.get("price", 0)
+                agent.wealth -= item_price
 
             action.success = response.status_code < 400
-            action.result = response.json() if action.success else response.text
+            action.result = orjson.loads(response.content) if action.success else response.text
             return action.success
 
         except Exception as e:
@@ -305,30 +399,51 @@ class AgentOrchestrator:
             action.result = str(e)
             return False
 
-    async def process_agent_batch(self, agents: List[Agent]) -> List[AgentAction]:
-        """Process a batch of agents in parallel using LLM"""
-        prompts = []
-        market_dict = self.market_state.to_dict()
+    async def process_agent_batch(
+        self,
+        agents: List[Agent],
+        market_dict: Optional[Dict[str, Any]] = None,
+        market_json: Optional[str] = None,
+    ) -> List[AgentAction]:
+        """
+        Process a batch of agents in parallel using LLM. run_tick passes the
+        tick's market dict and its shared serialization so they are built once.
+        """
+        if market_dict is None:
+            market_dict = self.market_state.to_dict()
+            market_json = shared_market_state_json(market_dict)
+
+        # Longest expected responses first; the sort is stable, so agents
+        # sharing a personality stay adjacent
+        order = sorted(
+            range(len(agents)),
+            key=lambda i: -EXPECTED_RESPONSE_TOKENS.get(agents[i].personality, 200),
+        )
 
-        for agent in agents:
+        prompts = []
+        for i in order:
+            agent = agents[i]
             prompts.append({
                 "system_prompt": agent.get_system_prompt(),
-                "prompt": agent.get_decision_prompt(market_dict)
+                "prompt": agent.get_decision_prompt(market_dict, market_json),
+                "agent_id": agent.id,
+                "max_tokens": EXPECTED_RESPONSE_TOKENS.get(agent.personality, 200),
             })
 
-        # Batch generate decisions
-        responses = await self.llm_client.batch_generate(prompts)
-
-        actions = []
-        for agent, response in zip(agents, responses):
+        # Parse each decision as soon as its response arrives instead of
+        # waiting for the slowest generation in the batch
+        actions: List[Optional[Tuple[Agent, AgentAction]]] = [None] * len(agents)
+        async for prompt_index, response in self.llm_client.iter_generate(prompts):
+            index = order[prompt_index]
+            agent = agents[index]
             try:
                 # Parse JSON response
-                decision = json.loads(response)
-                action = AgentAction(
-                    agent_id=agent.id,
-                    action_type=decision.get("action", "WAIT"),
-                    params=decision.get("params", {}),
-                    reasoning=decision.get("reasoning", "")
+                decision = orjson.loads(response)
+                action = self.action_pool.acquire(
+                    agent.id,
+                    decision.get("action", "WAIT"),
+                    decision.get("params", {}),
+                    decision.get("reasoning", ""),
                 )
 
                 # Update agent memory
@@ -339,12 +454,12 @@ class AgentOrchestrator:
                     "reasoning": action.reasoning
                 })
 
-                actions.append((agent, action))
+                actions[index] = (agent, action)
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 log(f"Failed to parse response for {agent.name}: {response[:200]}")
                 log(f"JSON error: {e}")
-                actions.append((agent, AgentAction(agent.id, "WAIT", {}, "Parse error")))
+                actions[index] = (agent, self.action_pool.acquire(agent.id, "WAIT", {}, "Parse error"))
 
         return actions
 
@@ -356,47 +471,81 @@ class AgentOrchestrator:
 
         # Fetch current market state
         await self.fetch_market_state()
+        self.data_exporter.begin_tick(self.market_state.tick)
+
+        # The market dict and its serialization are the same for every agent
+        # this tick, so build them once
+        market_dict = self.market_state.to_dict()
+        market_json = shared_market_state_json(market_dict)
 
-        # Log snapshot for data export
+        # Log snapshot for data export; it reads live agent state, so it runs
+        # now rather than through the export queue
         self.data_exporter.log_snapshot(
             tick=self.market_state.tick,
             agents=self.agents,
-            market_state=self.market_state.to_dict()
+            market_state=market_dict
         )
 
-        # Process agents in batches
-        agent_list = list(self.agents.values())
-        all_actions = []
-
-        for i in range(0, len(agent_list), self.batch_size):
-            batch = agent_list[i:i + self.batch_size]
-            actions = await self.process_agent_batch(batch)
-            all_actions.extend(actions)
-
-        # Execute all actions and log them
-        successful = 0
-        for agent, action in all_actions:
-            wealth_before = agent.wealth
-
-            if action.action_type not in ["OBSERVE", "WAIT"]:
+        # Submit every batch at once so the LLM server can schedule all of
+        # the tick's requests together instead of one batch at a time
+        if self._agent_list_cache is None:
+            # Grouped by personality so requests sharing a system prompt are
+            # submitted together and hit the server's prefix cache back to back
+            self._agent_list_cache = sorted(
+                self.agents.values(), key=lambda a: PERSONALITY_CODES[a.personality]
+            )
+        agent_list = self._agent_list_cache
+        batches = await asyncio.gather(*(
+            self.process_agent_batch(agent_list[i:i + self.batch_size], market_dict, market_json)
+            for i in range(0, len(agent_list), self.batch_size)
+        ))
+        all_actions = [item for actions in batches for item in actions]
+
+        # Execute all actions concurrently, capped so the gateway isn't
+        # overrun, and log each one as it completes
+        semaphore = asyncio.Semaphore(ACTION_CONCURRENCY)
+
+        async def execute_and_log(agent: Agent, action: AgentAction) -> bool:
+            async with semaphore:
+                wealth_before = agent.wealth
                 success = await self.execute_agent_action(agent, action)
-                if success:
-                    successful += 1
-                log(f"  {agent.name}: {action.action_type} - {'Success' if success else 'Failed'}")
-
-                # Log action for data export
-                self.data_exporter.log_action(
-                    tick=self.market_state.tick,
-                    agent=agent,
-                    action_type=action.action_type,
-                    action_params=action.params,
-                    reasoning=action.reasoning,
-                    success=success,
-                    wealth_before=wealth_before,
-                    wealth_after=agent.wealth
-                )
+            # Per-action line at DEBUG; formatting is skipped unless enabled
+            logger.debug("  %s: %s - %s", agent.name, action.action_type, "Success" if success else "Failed")
+
+            # Log action for data export
+            self._queue_export(
+                self.data_exporter.log_action,
+                tick=self.market_state.tick,
+                agent=agent,
+                action_type=action.action_type,
+                action_params=action.params,
+                reasoning=action.reasoning,
+                success=success,
+                wealth_before=wealth_before,
+                wealth_after=agent.wealth
+            )
+            return success
+
+        results = await asyncio.gather(*(
+            execute_and_log(agent, action)
+            for agent, action in all_actions
+            if action.action_type not in PASSIVE_ACTIONS
+        ))
+        successful = sum(results)
 
         log(f"\nTick {self.market_state.tick} complete: {successful}/{len(all_actions)} actions succeeded")
+        logger.debug(
+            "Gateway: %d requests, peak %d concurrent",
+            self._gateway_responses, self._gateway_peak_in_flight,
+        )
+        # Every request of the tick has finished (failed ones never reach
+        # the response hook), so the counters start over from zero
+        self._gateway_in_flight = self._gateway_peak_in_flight = 0
+        self._gateway_responses = 0
+
+        # Every action has been executed and logged; recycle them next tick
+        for _, action in all_actions:
+            self.action_pool.release(action)
 
     async def run_simulation(self, ticks: int = 100):
         """Run the full simulation for a number of ticks"""
@@ -422,10 +571,11 @@ class AgentOrchestrator:
 
         # Print final statistics
         self.print_statistics()
+        await self.flush_exports()
 
         # Auto-export data
         log("\nExporting simulation data...")
-        paths = self.data_exporter.export_all()
+        paths = await self.data_exporter.export_all_async()
         log(f"Data exported to: {paths}")
 
     def print_statistics(self):
@@ -438,22 +588,25 @@ class AgentOrchestrator:
             log("No agents in simulation")
             return
 
-        wealths = [a.wealth for a in self.agents.values()]
-        log(f"Total Agents: {len(self.agents)}")
-        log(f"Total Wealth: ${sum(wealths):,.2f}")
-        log(f"Average Wealth: ${sum(wealths)/len(wealths):,.2f}")
-        log(f"Richest Agent: ${max(wealths):,.2f}")
-        log(f"Poorest Agent: ${min(wealths):,.2f}")
+        # Single pass filling wealth and personality-code columns
+        n = len(self.agents)
+        wealths = np.empty(n, dtype=np.float64)
+        codes = np.empty(n, dtype=np.int8)
+        for i, agent in enumerate(self.agents.values()):
+            wealths[i] = agent.wealth
+            codes[i] = PERSONALITY_CODES[agent.personality]
+
+        log(f"Total Agents: {n}")
+        log(f"Total Wealth: ${wealths.sum():,.2f}")
+        log(f"Average Wealth: ${wealths.mean():,.2f}")
+        log(f"Richest Agent: ${wealths.max():,.2f}")
+        log(f"Poorest Agent: ${wealths.min():,.2f}")
 
         # Wealth by personality
-        by_personality = {}
-        for agent in self.agents.values():
-            p = agent.personality.value
-            if p not in by_personality:
-                by_personality[p] = []
-            by_personality[p].append(agent.wealth)
+        counts = np.bincount(codes, minlength=len(PERSONALITY_NAMES))
+        totals = np.bincount(codes, weights=wealths, minlength=len(PERSONALITY_NAMES))
 
         log("\nWealth by Personality:")
-        for personality, wealths in by_personality.items():
-            avg = sum(wealths) / len(wealths)
-            log(f"  {personality}: ${avg:,.2f} avg ({len(wealths)} agents)")
+        for code in np.flatnonzero(counts).tolist():
+            avg = totals[code] / counts[code]
+            log(f"  {PERSONALITY_NAMES[code]}: ${avg:,.2f} avg ({counts[code]} agents)")